@@ -12,10 +12,14 @@ import json
 import os
 import subprocess
 import sys
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+profile_phase = nullcontext
+
 
 def eprint(msg: str) -> None:
     print(msg, file=sys.stderr)
@@ -246,13 +250,15 @@ def main() -> int:
     args = parser.parse_args()
 
     try:
-        payload = load_payload(args.input, args.provider)
+        with profile_phase("load"):
+            payload = load_payload(args.input, args.provider)
     except Exception as exc:
         eprint(str(exc))
         return 1
 
-    entries = parse_daily_entries(payload)
-    entries = filter_by_days(entries, args.days)
+    with profile_phase("parse"):
+        entries = parse_daily_entries(payload)
+        entries = filter_by_days(entries, args.days)
 
     if args.mode == "current":
         model = args.model
@@ -307,4 +313,8 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    if os.environ.get("OPENCLAW_SKILL_PROFILE"):
+        sys.path.append(str(Path(__file__).resolve().parents[2] / "skill-creator" / "scripts"))
+        from skill_profile import profiled
+        main = profiled(main)
     raise SystemExit(main())
@@ -14,13 +14,56 @@ Usage:
 
 Multi-image editing (up to 14 images):
     uv run generate_image.py --prompt "combine these images" --filename "output.png" -i img1.png -i img2.png -i img3.png
+
+Streaming with a deadline (saves the image as soon as its part arrives):
+    uv run generate_image.py --prompt "your image description" --filename "output.png" --stream --timeout 120
+
+Latency breakdown (also enabled by NANO_BANANA_TIMINGS=1; NANO_BANANA_TIMINGS_FILE appends NDJSON):
+    uv run generate_image.py --prompt "your image description" --filename "output.png" --timings --timings-file metrics.ndjson
+
+Upscale the saved output beyond native resolution (tiled, multi-process, streamed to disk):
+    uv run generate_image.py --prompt "your image description" --filename "output.png" --resolution 4K --upscale 16K
+
+Persistent worker (keeps the SDK, client and PIL warm; later invocations forward to it automatically):
+    uv run generate_image.py --serve [--socket PATH]
 """
 
 import argparse
+import asyncio
+import importlib
+import json
 import os
+import struct
 import sys
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 
+MODEL = "gemini-3-pro-image-preview"
+
+# Long-edge pixel targets for --upscale
+UPSCALE_TARGETS = {"8K": 8192, "16K": 16384}
+# Output rows rendered per upscale task; bounds per-worker memory to a strip
+UPSCALE_STRIP_ROWS = 256
+# Extra rows rendered above/below each strip so sharpening has no seams
+UPSCALE_MARGIN = 8
+
+# Clients kept warm across requests, keyed by (api_key, timeout)
+_CLIENTS: dict = {}
+
+profile_phase = nullcontext
+
+# Persistent worker settings for skill-creator's skill_worker (see --serve)
+WORKER_OPTIONS = {
+    "name": "nano-banana-pro",
+    "env_prefix": "NANO_BANANA_WORKER",
+    "forward_env": ("GEMINI_", "GOOGLE_", "NANO_BANANA_"),
+}
+
 
 def get_api_key(provided_key: str | None) -> str | None:
     """Get API key from argument first, then environment."""
@@ -29,7 +72,354 @@ def get_api_key(provided_key: str | None) -> str | None:
     return os.environ.get("GEMINI_API_KEY")
 
 
-def main():
+def get_client(api_key: str, timeout: float | None = None):
+    """Return a cached genai client for this key and timeout, creating it on first use."""
+    key = (api_key, timeout)
+    if key not in _CLIENTS:
+        from google import genai
+        from google.genai import types
+
+        # HttpOptions.timeout is in milliseconds
+        http_options = None
+        if timeout is not None:
+            http_options = types.HttpOptions(timeout=int(timeout * 1000))
+        _CLIENTS[key] = genai.Client(api_key=api_key, http_options=http_options)
+    return _CLIENTS[key]
+
+
+class Timings:
+    """
+    Opt-in latency breakdown for a single run.
+
+    Phases are recorded with monotonic start offsets and durations (ms) relative
+    to process start, so overlapping phases (e.g. decode inside a streamed
+    request) stay visible. When disabled every method is a cheap no-op.
+    """
+
+    def __init__(self, enabled: bool = False, metrics_file: str | None = None):
+        self.enabled = enabled
+        self.metrics_file = metrics_file
+        self.origin = time.monotonic()
+        self.phases: list[dict] = []
+        self.bytes: dict[str, int] = {}
+        self.info: dict = {}
+
+    @contextmanager
+    def phase(self, name: str, **info):
+        with profile_phase(name):
+            if not self.enabled:
+                yield
+                return
+            start = time.monotonic()
+            try:
+                yield
+            finally:
+                end = time.monotonic()
+                self.phases.append({
+                    "name": name,
+                    "start_ms": round((start - self.origin) * 1000, 3),
+                    "ms": round((end - start) * 1000, 3),
+                    **info,
+                })
+
+    def add_bytes(self, key: str, count: int) -> None:
+        if self.enabled:
+            self.bytes[key] = self.bytes.get(key, 0) + count
+
+    def report(self, ok: bool) -> None:
+        """Print a one-line summary to stderr and append an NDJSON record if configured."""
+        if not self.enabled:
+            return
+        total_ms = round((time.monotonic() - self.origin) * 1000, 3)
+
+        # Sum repeated phases (per-input loads, per-part decodes) for the summary line
+        totals: dict[str, float] = {}
+        for entry in self.phases:
+            totals[entry["name"]] = totals.get(entry["name"], 0.0) + entry["ms"]
+        parts = [f"{name}={ms:.0f}ms" for name, ms in totals.items()]
+        parts.append(f"total={total_ms:.0f}ms")
+        parts.extend(f"{key}={count}B" for key, count in self.bytes.items())
+        print(f"Timings: {' '.join(parts)}", file=sys.stderr)
+
+        if self.metrics_file:
+            record = {
+                "ts": time.time(),
+                "script": "generate_image",
+                "ok": ok,
+                "total_ms": total_ms,
+                "phases": self.phases,
+                "bytes": self.bytes,
+                **self.info,
+            }
+            try:
+                with open(self.metrics_file, "a", encoding="utf-8") as fh:
+                    fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+            except OSError as e:
+                print(f"Warning: could not write timings to '{self.metrics_file}': {e}", file=sys.stderr)
+
+
+def save_image(
+    image_data,
+    output_path: Path,
+    timings: Timings | None = None,
+    cancelled: threading.Event | None = None,
+) -> None:
+    """Decode inline image data and write it to output_path as an RGB PNG.
+
+    The PNG is written to a temporary sibling first and renamed into place, so a
+    cancelled or failed save never leaves a truncated file behind. When run on a
+    worker thread, setting cancelled stops the save before the rename, since the
+    thread itself cannot be interrupted.
+    """
+    from io import BytesIO
+
+    from PIL import Image as PILImage
+
+    timings = timings or Timings()
+
+    with timings.phase("decode"):
+        # inline_data.data is already bytes, not base64
+        if isinstance(image_data, str):
+            # If it's a string, it might be base64
+            import base64
+            image_data = base64.b64decode(image_data)
+        timings.add_bytes("response_image", len(image_data))
+
+        image = PILImage.open(BytesIO(image_data))
+        if timings.enabled:
+            # Force the pixel decode here so it isn't attributed to convert
+            image.load()
+
+    with timings.phase("convert", mode=image.mode):
+        # Ensure RGB mode for PNG (convert RGBA to RGB with white background if needed)
+        if image.mode == 'RGBA':
+            rgb_image = PILImage.new('RGB', image.size, (255, 255, 255))
+            rgb_image.paste(image, mask=image.split()[3])
+            image = rgb_image
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    try:
+        with timings.phase("save"):
+            image.save(str(tmp_path), 'PNG')
+            if cancelled is not None and cancelled.is_set():
+                return
+            os.replace(tmp_path, output_path)
+        if timings.enabled:
+            timings.add_bytes("output", output_path.stat().st_size)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+async def generate_image_async(
+    client,
+    contents,
+    config,
+    output_path: Path,
+    *,
+    model: str = MODEL,
+    timeout: float | None = None,
+    on_text=None,
+    timings: Timings | None = None,
+) -> bool:
+    """
+    Stream a generation via the async SDK and save the image as soon as it arrives.
+
+    Parts are handled as each chunk streams in: text is passed to on_text and the
+    first complete image part is decoded off the event loop and saved. The whole
+    request is bounded by timeout (seconds), raising asyncio.TimeoutError when it
+    expires, and the coroutine can be cancelled like any other task, so many
+    generations can be multiplexed on one event loop. A timeout or cancellation
+    during the save leaves output_path unwritten, unless the final rename had
+    already happened.
+
+    Returns True if an image was saved.
+    """
+    timings = timings or Timings()
+
+    async def consume() -> bool:
+        image_saved = False
+        with timings.phase("request"):
+            stream = await client.aio.models.generate_content_stream(
+                model=model,
+                contents=contents,
+                config=config,
+            )
+            first_chunk = True
+            async for chunk in stream:
+                if first_chunk:
+                    timings.info["first_chunk_ms"] = round((time.monotonic() - timings.origin) * 1000, 3)
+                    first_chunk = False
+                for part in chunk.parts or []:
+                    if part.text is not None:
+                        if on_text is not None:
+                            on_text(part.text)
+                    elif part.inline_data is not None and not image_saved:
+                        # Cancelling the await does not stop the thread; the event does
+                        cancelled = threading.Event()
+                        try:
+                            await asyncio.to_thread(save_image, part.inline_data.data, output_path, timings, cancelled)
+                        except asyncio.CancelledError:
+                            cancelled.set()
+                            raise
+                        image_saved = True
+        return image_saved
+
+    if timeout is None:
+        return await consume()
+    return await asyncio.wait_for(consume(), timeout)
+
+
+# Source image loaded once per upscale worker process
+_UPSCALE_SOURCE = None
+
+
+def _init_upscale_worker(source_path: str) -> None:
+    global _UPSCALE_SOURCE
+    from PIL import Image as PILImage
+
+    _UPSCALE_SOURCE = PILImage.open(source_path).convert("RGB")
+
+
+def _upscale_strip(width: int, height: int, top: int, bottom: int, sharpen: int) -> tuple[bytes, int, int]:
+    """
+    Render output rows [top, bottom) of the upscaled image and deflate them.
+
+    The strip is resampled straight from the source with a fractional box, so
+    strips match a full-image resize to within rounding (a level or two per
+    channel, most of it from sharpening) with no visible seams. Returns the raw-deflate
+    stream (sync-flushed so strips can be concatenated), the Adler-32 of the
+    uncompressed scanlines and their length.
+    """
+    from PIL import Image as PILImage
+    from PIL import ImageFilter
+
+    src = _UPSCALE_SOURCE
+    scale_y = src.height / height
+    margin = UPSCALE_MARGIN if sharpen else 0
+    render_top = max(0, top - margin)
+    render_bottom = min(height, bottom + margin)
+
+    strip = src.resize(
+        (width, render_bottom - render_top),
+        PILImage.LANCZOS,
+        box=(0, render_top * scale_y, src.width, render_bottom * scale_y),
+    )
+    if sharpen:
+        strip = strip.filter(ImageFilter.UnsharpMask(radius=2, percent=sharpen, threshold=2))
+    strip = strip.crop((0, top - render_top, width, bottom - render_top))
+
+    # PNG scanlines: filter type 0 (None) followed by the RGB bytes of the row
+    pixels = strip.tobytes()
+    row_bytes = width * 3
+    raw = b"".join(
+        b"\x00" + pixels[offset:offset + row_bytes]
+        for offset in range(0, len(pixels), row_bytes)
+    )
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    data = compressor.compress(raw) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    return data, zlib.adler32(raw), len(raw)
+
+
+def _adler32_combine(adler1: int, adler2: int, len2: int) -> int:
+    """Adler-32 of two concatenated buffers from their checksums (port of zlib's adler32_combine)."""
+    base = 65521
+    rem = len2 % base
+    sum1 = adler1 & 0xFFFF
+    sum2 = (rem * sum1) % base
+    sum1 += (adler2 & 0xFFFF) + base - 1
+    sum2 += (adler1 >> 16) + (adler2 >> 16) + base - rem
+    if sum1 >= base:
+        sum1 -= base
+    if sum1 >= base:
+        sum1 -= base
+    if sum2 >= base << 1:
+        sum2 -= base << 1
+    if sum2 >= base:
+        sum2 -= base
+    return sum1 | (sum2 << 16)
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def upscale_image(
+    source_path: Path,
+    output_path: Path,
+    long_edge: int,
+    *,
+    sharpen: int = 60,
+    workers: int | None = None,
+) -> tuple[int, int]:
+    """
+    Upscale an image so its long edge is long_edge pixels, writing a PNG progressively.
+
+    The output is rendered as full-width strips across a process pool; each
+    worker resamples (Lanczos), optionally sharpens and deflates its strip, and
+    the parent appends the compressed strips to the PNG in order as they
+    complete. Memory stays bounded by a few strips rather than the full
+    image, so 8K/16K targets are practical on ordinary machines.
+
+    Returns the output (width, height).
+    """
+    from PIL import Image as PILImage
+
+    with PILImage.open(source_path) as src:
+        src_width, src_height = src.size
+    factor = long_edge / max(src_width, src_height)
+    width = max(1, round(src_width * factor))
+    height = max(1, round(src_height * factor))
+
+    workers = workers or os.cpu_count() or 1
+    strips = [
+        (top, min(top + UPSCALE_STRIP_ROWS, height))
+        for top in range(0, height, UPSCALE_STRIP_ROWS)
+    ]
+
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    try:
+        with open(tmp_path, "wb") as fh, ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_upscale_worker,
+            initargs=(str(source_path),),
+        ) as pool:
+            fh.write(b"\x89PNG\r\n\x1a\n")
+            # 8-bit RGB, deflate, adaptive filtering, no interlace
+            fh.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+            # zlib header (deflate, 32K window, default compression)
+            fh.write(_png_chunk(b"IDAT", b"\x78\x9c"))
+
+            # Keep a bounded window of strips in flight and write them in order
+            adler = 1
+            pending = []
+            next_strip = 0
+            while next_strip < len(strips) or pending:
+                while next_strip < len(strips) and len(pending) < workers * 2:
+                    top, bottom = strips[next_strip]
+                    pending.append(pool.submit(_upscale_strip, width, height, top, bottom, sharpen))
+                    next_strip += 1
+                data, strip_adler, strip_len = pending.pop(0).result()
+                adler = _adler32_combine(adler, strip_adler, strip_len)
+                fh.write(_png_chunk(b"IDAT", data))
+
+            # Empty final deflate block, then the Adler-32 trailer
+            fh.write(_png_chunk(b"IDAT", b"\x03\x00" + struct.pack(">I", adler)))
+            fh.write(_png_chunk(b"IEND", b""))
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return width, height
+
+
+def main(argv: list[str] | None = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["--serve"]:
+        serve(argv[1:])
+        return
+
     parser = argparse.ArgumentParser(
         description="Generate images using Nano Banana Pro (Gemini 3 Pro Image)"
     )
@@ -40,8 +430,7 @@ def main():
     )
     parser.add_argument(
         "--filename", "-f",
-        required=True,
-        help="Output filename (e.g., sunset-mountains.png)"
+        help="Output filename (e.g., sunset-mountains.png); required unless --queue is set"
     )
     parser.add_argument(
         "--input-image", "-i",
@@ -60,29 +449,107 @@ def main():
         "--api-key", "-k",
         help="Gemini API key (overrides GEMINI_API_KEY env var)"
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the response and save the image as soon as its part arrives"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Deadline for the generation request in seconds (default: no deadline)"
+    )
+    parser.add_argument(
+        "--upscale",
+        choices=sorted(UPSCALE_TARGETS, key=UPSCALE_TARGETS.get),
+        help="Also write <name>-<target>.png upscaled to 8K or 16K on the long edge (tiled, multi-process)"
+    )
+    parser.add_argument(
+        "--sharpen",
+        type=int,
+        default=60,
+        metavar="PERCENT",
+        help="Unsharp-mask strength applied while upscaling (default: 60, 0 disables)"
+    )
+    parser.add_argument(
+        "--upscale-workers",
+        type=int,
+        metavar="N",
+        help="Processes used for upscaling (default: CPU count)"
+    )
+    parser.add_argument(
+        "--queue",
+        action="store_true",
+        help="Submit to the shared image job queue (openai-image-gen/scripts/image_jobs.py) instead of generating now; "
+             "the runner generates it with its own GEMINI_API_KEY"
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print a per-phase latency breakdown to stderr (or set NANO_BANANA_TIMINGS=1)"
+    )
+    parser.add_argument(
+        "--timings-file",
+        metavar="PATH",
+        help="Append the timings as an NDJSON record to PATH (or set NANO_BANANA_TIMINGS_FILE); implies --timings"
+    )
+
+    args = parser.parse_args(argv)
+    if not args.filename and not args.queue:
+        parser.error("the following arguments are required: --filename/-f")
+    if args.queue and args.api_key:
+        # Jobs are stored on disk; the key is never written there
+        parser.error("--api-key cannot be used with --queue; set GEMINI_API_KEY where image_jobs.py run executes")
+    if args.queue:
+        # The runner saves queued images to its outputs/ directory as generated
+        unsupported = [
+            flag for flag, value in (
+                ("--filename", args.filename),
+                ("--upscale", args.upscale),
+                ("--stream", args.stream),
+                ("--timeout", args.timeout),
+            )
+            if value not in (None, False)
+        ]
+        if unsupported:
+            parser.error(f"{', '.join(unsupported)} cannot be used with --queue; image_jobs.py run writes to its own outputs/ directory")
+
+    metrics_file = args.timings_file or os.environ.get("NANO_BANANA_TIMINGS_FILE") or None
+    timings = Timings(
+        enabled=bool(args.timings or metrics_file or os.environ.get("NANO_BANANA_TIMINGS")),
+        metrics_file=metrics_file,
+    )
+    ok = False
+    try:
+        run(args, timings)
+        ok = True
+    finally:
+        timings.report(ok)
 
-    args = parser.parse_args()
 
-    # Get API key
+def run(args, timings: Timings) -> None:
+    """Generate or edit an image as described by the parsed CLI args."""
+
+    # Get API key (queued jobs are generated later by the runner, with its own key)
     api_key = get_api_key(args.api_key)
-    if not api_key:
+    if not api_key and not args.queue:
         print("Error: No API key provided.", file=sys.stderr)
         print("Please either:", file=sys.stderr)
         print("  1. Provide --api-key argument", file=sys.stderr)
         print("  2. Set GEMINI_API_KEY environment variable", file=sys.stderr)
         sys.exit(1)
 
-    # Import here after checking API key to avoid slow import on error
-    from google import genai
-    from google.genai import types
-    from PIL import Image as PILImage
-
-    # Initialise client
-    client = genai.Client(api_key=api_key)
+    if args.timeout is not None and args.timeout <= 0:
+        print("Error: --timeout must be a positive number of seconds.", file=sys.stderr)
+        sys.exit(1)
+    if args.sharpen < 0 or (args.upscale_workers is not None and args.upscale_workers < 1):
+        print("Error: --sharpen must be >= 0 and --upscale-workers >= 1.", file=sys.stderr)
+        sys.exit(1)
 
-    # Set up output path
-    output_path = Path(args.filename)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Import here after checking API key to avoid slow import on error
+    with timings.phase("import"):
+        from PIL import Image as PILImage
 
     # Load input images if provided (up to 14 supported by Nano Banana Pro)
     input_images = []
@@ -93,9 +560,14 @@ def main():
             sys.exit(1)
 
         max_input_dim = 0
-        for img_path in args.input_images:
+        for index, img_path in enumerate(args.input_images):
             try:
-                img = PILImage.open(img_path)
+                with timings.phase("load", index=index):
+                    img = PILImage.open(img_path)
+                    if timings.enabled:
+                        # open() only reads the header; decode now so it isn't counted as request time
+                        img.load()
+                    timings.add_bytes("input", os.path.getsize(img_path))
                 input_images.append(img)
                 print(f"Loaded input image: {img_path}")
 
@@ -116,6 +588,17 @@ def main():
                 output_resolution = "1K"
             print(f"Auto-detected resolution: {output_resolution} (from max input dimension {max_input_dim})")
 
+    if args.queue:
+        submit_queued_job(args.prompt, output_resolution, args.input_images or [])
+        return
+
+    with timings.phase("import"):
+        from google.genai import types
+
+    # Initialise client (reused when running inside a warm worker)
+    with timings.phase("client_init"):
+        client = get_client(api_key, args.timeout)
+
     # Build contents (images first if editing, prompt only if generating)
     if input_images:
         contents = [*input_images, args.prompt]
@@ -125,46 +608,59 @@ def main():
         contents = args.prompt
         print(f"Generating image with resolution {output_resolution}...")
 
+    # Set up output path
+    output_path = Path(args.filename)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    timings.info.update(resolution=output_resolution, inputs=len(input_images), stream=args.stream)
+
+    config = types.GenerateContentConfig(
+        response_modalities=["TEXT", "IMAGE"],
+        image_config=types.ImageConfig(
+            image_size=output_resolution
+        )
+    )
+
     try:
-        response = client.models.generate_content(
-            model="gemini-3-pro-image-preview",
-            contents=contents,
-            config=types.GenerateContentConfig(
-                response_modalities=["TEXT", "IMAGE"],
-                image_config=types.ImageConfig(
-                    image_size=output_resolution
+        if args.stream:
+            printed_prefix = False
+
+            def on_text(text):
+                nonlocal printed_prefix
+                if not printed_prefix:
+                    print("Model response: ", end="")
+                    printed_prefix = True
+                print(text, end="", flush=True)
+
+            image_saved = asyncio.run(
+                generate_image_async(
+                    client,
+                    contents,
+                    config,
+                    output_path,
+                    timeout=args.timeout,
+                    on_text=on_text,
+                    timings=timings,
                 )
             )
-        )
+            if printed_prefix:
+                print()
+        else:
+            with timings.phase("request"):
+                response = client.models.generate_content(
+                    model=MODEL,
+                    contents=contents,
+                    config=config
+                )
 
-        # Process response and convert to PNG
-        image_saved = False
-        for part in response.parts:
-            if part.text is not None:
-                print(f"Model response: {part.text}")
-            elif part.inline_data is not None:
-                # Convert inline data to PIL Image and save as PNG
-                from io import BytesIO
-
-                # inline_data.data is already bytes, not base64
-                image_data = part.inline_data.data
-                if isinstance(image_data, str):
-                    # If it's a string, it might be base64
-                    import base64
-                    image_data = base64.b64decode(image_data)
-
-                image = PILImage.open(BytesIO(image_data))
-
-                # Ensure RGB mode for PNG (convert RGBA to RGB with white background if needed)
-                if image.mode == 'RGBA':
-                    rgb_image = PILImage.new('RGB', image.size, (255, 255, 255))
-                    rgb_image.paste(image, mask=image.split()[3])
-                    rgb_image.save(str(output_path), 'PNG')
-                elif image.mode == 'RGB':
-                    image.save(str(output_path), 'PNG')
-                else:
-                    image.convert('RGB').save(str(output_path), 'PNG')
-                image_saved = True
+            # Process response and convert to PNG
+            image_saved = False
+            for part in response.parts:
+                if part.text is not None:
+                    print(f"Model response: {part.text}")
+                elif part.inline_data is not None:
+                    save_image(part.inline_data.data, output_path, timings)
+                    image_saved = True
 
         if image_saved:
             full_path = output_path.resolve()
@@ -175,10 +671,111 @@ def main():
             print("Error: No image was generated in the response.", file=sys.stderr)
             sys.exit(1)
 
+    except asyncio.TimeoutError:
+        print(f"Error: Generation timed out after {args.timeout:g}s.", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(f"Error generating image: {e}", file=sys.stderr)
         sys.exit(1)
 
+    if args.upscale:
+        upscaled_path = output_path.with_name(f"{output_path.stem}-{args.upscale}.png")
+        print(f"Upscaling to {args.upscale}...")
+        try:
+            with timings.phase("upscale", target=args.upscale):
+                width, height = upscale_image(
+                    output_path,
+                    upscaled_path,
+                    UPSCALE_TARGETS[args.upscale],
+                    sharpen=args.sharpen,
+                    workers=args.upscale_workers,
+                )
+            timings.add_bytes("upscaled_output", upscaled_path.stat().st_size)
+        except Exception as e:
+            print(f"Error upscaling image: {e}", file=sys.stderr)
+            sys.exit(1)
+        # Not emitted as MEDIA: print-size files are too large to attach in chat
+        print(f"Upscaled image saved ({width}x{height}): {upscaled_path.resolve()}")
+
+
+def submit_queued_job(prompt: str, resolution: str, input_images: list[str]) -> None:
+    """Hand the generation to the shared job runner that lives in openai-image-gen."""
+    import hashlib
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "openai-image-gen" / "scripts"))
+    try:
+        from image_jobs import submit_job
+    except ImportError as e:
+        print(f"Error: --queue needs the openai-image-gen skill installed next to nano-banana-pro ({e}).", file=sys.stderr)
+        sys.exit(1)
+
+    params = {
+        "prompt": prompt,
+        "resolution": resolution,
+        "input_images": [str(Path(path).resolve()) for path in input_images],
+        # Hash inputs so edited files with the same path are not deduplicated
+        "input_sha256": [hashlib.sha256(Path(path).read_bytes()).hexdigest() for path in input_images],
+    }
+    job_id, state = submit_job("gemini", params)
+    print(f"{state}: {job_id}")
+    print("Run the queue with: uv run openai-image-gen/scripts/image_jobs.py run")
+
+
+def worker_socket_exists() -> bool:
+    """Cheap check for a worker socket (skill_worker's default path), so plain runs skip the worker import."""
+    if os.environ.get("NANO_BANANA_WORKER") == "0":
+        return False
+    path = os.environ.get("NANO_BANANA_WORKER_SOCKET")
+    if not path:
+        base = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(tempfile.gettempdir(), f"openclaw-workers-{os.getuid()}")
+        path = os.path.join(base, f"nano-banana-pro-{os.getuid()}.sock")
+    return os.path.exists(path)
+
+
+def warm_up() -> None:
+    """Preload the SDK, PIL and a client for the ambient key before the worker forks."""
+    importlib.import_module("google.genai")
+    importlib.import_module("PIL.Image")
+
+    api_key = get_api_key(None)
+    if api_key:
+        get_client(api_key)
+
+
+def serve(argv: list[str]) -> None:
+    """Serve forwarded invocations on a Unix socket, with the SDK already warm."""
+    worker = import_shared("skill_worker")
+    if worker is None:
+        print("Error: --serve needs the skill-creator skill installed next to nano-banana-pro.", file=sys.stderr)
+        sys.exit(1)
+    exit_code = worker.serve(
+        argv,
+        main,
+        warm_up=warm_up,
+        prog="generate_image.py --serve",
+        description="Run a persistent worker that keeps the Gemini SDK warm",
+        **WORKER_OPTIONS,
+    )
+    if exit_code:
+        sys.exit(exit_code)
+
+
+def import_shared(name: str):
+    """Import skill_worker or skill_profile from skill-creator/scripts, or None if that skill is missing."""
+    scripts = str(Path(__file__).resolve().parents[2] / "skill-creator" / "scripts")
+    if scripts not in sys.path:
+        sys.path.append(scripts)
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:2] != ["--serve"] and worker_socket_exists():
+        worker = import_shared("skill_worker")
+        exit_code = worker.forward(sys.argv[1:], **WORKER_OPTIONS) if worker else None
+        if exit_code is not None:
+            sys.exit(exit_code)
+    profiler = os.environ.get("OPENCLAW_SKILL_PROFILE") and import_shared("skill_profile")
+    (profiler.profiled(main) if profiler else main)()
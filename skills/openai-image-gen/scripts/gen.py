@@ -2,15 +2,29 @@
 import argparse
 import base64
 import datetime as dt
+import html
 import json
 import os
 import random
 import re
+import ssl
 import sys
 import urllib.error
 import urllib.request
+from contextlib import nullcontext
 from pathlib import Path
 
+_SSL_CONTEXT: ssl.SSLContext | None = None
+profile_phase = nullcontext
+
+
+def ssl_context() -> ssl.SSLContext:
+    """Shared TLS context; loading the CA bundle is the costliest part of a cold request."""
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        _SSL_CONTEXT = ssl.create_default_context()
+    return _SSL_CONTEXT
+
 
 def slugify(text: str) -> str:
     text = text.lower().strip()
@@ -119,28 +133,46 @@ def request_images(
         data=body,
     )
     try:
-        with urllib.request.urlopen(req, timeout=300) as resp:
+        with urllib.request.urlopen(req, timeout=300, context=ssl_context()) as resp:
             return json.loads(resp.read().decode("utf-8"))
     except urllib.error.HTTPError as e:
         payload = e.read().decode("utf-8", errors="replace")
         raise RuntimeError(f"OpenAI Images API failed ({e.code}): {payload}") from e
 
 
-def write_gallery(out_dir: Path, items: list[dict]) -> None:
+def save_image_result(res: dict, filepath: Path) -> None:
+    """Write the first image of an Images API response (b64 or URL) to filepath."""
+    data = res.get("data", [{}])[0]
+    image_b64 = data.get("b64_json")
+    image_url = data.get("url")
+    if not image_b64 and not image_url:
+        raise RuntimeError(f"Unexpected response: {json.dumps(res)[:400]}")
+
+    if image_b64:
+        filepath.write_bytes(base64.b64decode(image_b64))
+    else:
+        try:
+            with urllib.request.urlopen(image_url, timeout=300, context=ssl_context()) as resp:
+                filepath.write_bytes(resp.read())
+        except urllib.error.URLError as e:
+            raise RuntimeError(f"Failed to download image from {image_url}: {e}") from e
+
+
+def write_gallery(out_dir: Path, items: list[dict], title: str = "openai-image-gen") -> None:
     thumbs = "\n".join(
         [
             f"""
 <figure>
-  <a href="{it["file"]}"><img src="{it["file"]}" loading="lazy" /></a>
-  <figcaption>{it["prompt"]}</figcaption>
+  <a href="{html.escape(it["file"])}"><img src="{html.escape(it["file"])}" loading="lazy" /></a>
+  <figcaption>{html.escape(it["prompt"])}</figcaption>
 </figure>
 """.strip()
             for it in items
         ]
     )
-    html = f"""<!doctype html>
+    page = f"""<!doctype html>
 <meta charset="utf-8" />
-<title>openai-image-gen</title>
+<title>{html.escape(title)}</title>
 <style>
   :root {{ color-scheme: dark; }}
   body {{ margin: 24px; font: 14px/1.4 ui-sans-serif, system-ui; background: #0b0f14; color: #e8edf2; }}
@@ -151,13 +183,13 @@ def write_gallery(out_dir: Path, items: list[dict]) -> None:
   figcaption {{ margin-top: 10px; color: #b7c2cc; }}
   code {{ color: #9cd1ff; }}
 </style>
-<h1>openai-image-gen</h1>
-<p>Output: <code>{out_dir.as_posix()}</code></p>
+<h1>{html.escape(title)}</h1>
+<p>Output: <code>{html.escape(out_dir.as_posix())}</code></p>
 <div class="grid">
 {thumbs}
 </div>
 """
-    (out_dir / "index.html").write_text(html, encoding="utf-8")
+    (out_dir / "index.html").write_text(page, encoding="utf-8")
 
 
 def main() -> int:
@@ -170,13 +202,12 @@ def main() -> int:
     ap.add_argument("--background", default="", help="Background transparency (GPT models only): transparent, opaque, or auto.")
     ap.add_argument("--output-format", default="", help="Output format (GPT models only): png, jpeg, or webp.")
     ap.add_argument("--style", default="", help="Image style (dall-e-3 only): vivid or natural.")
-    ap.add_argument("--out-dir", default="", help="Output directory (default: ./tmp/openai-image-gen-<ts>).")
+    ap.add_argument("--out-dir", default="", help="Output directory (default: ./tmp/openai-image-gen-<ts>; not used with --queue).")
+    ap.add_argument("--queue", action="store_true", help="Submit the images to the shared image job queue (image_jobs.py) instead of generating now; the runner uses its own OPENAI_API_KEY.")
     args = ap.parse_args()
-
-    api_key = (os.environ.get("OPENAI_API_KEY") or "").strip()
-    if not api_key:
-        print("Missing OPENAI_API_KEY", file=sys.stderr)
-        return 2
+    if args.queue and args.out_dir:
+        # Queued images land in the queue's outputs/ directory
+        ap.error("--out-dir cannot be used with --queue; image_jobs.py run writes to its own outputs/ directory")
 
     # Apply model-specific defaults if not specified
     default_size, default_quality = get_model_defaults(args.model)
@@ -188,11 +219,35 @@ def main() -> int:
         print(f"Warning: dall-e-3 only supports generating 1 image at a time. Reducing count from {count} to 1.", file=sys.stderr)
         count = 1
 
+    prompts = [args.prompt] * count if args.prompt else pick_prompts(count)
+
+    if args.queue:
+        from image_jobs import submit_job
+
+        for idx, prompt in enumerate(prompts, start=1):
+            params = {
+                "prompt": prompt,
+                "model": args.model,
+                "size": size,
+                "quality": quality,
+                "background": args.background,
+                "output_format": args.output_format,
+                "style": args.style,
+                # Repeats of one prompt are intentional variations, not duplicates
+                "variant": idx if args.prompt else 0,
+            }
+            job_id, state = submit_job("openai", params)
+            print(f"[{idx}/{len(prompts)}] {state}: {job_id} {prompt}")
+        return 0
+
+    api_key = (os.environ.get("OPENAI_API_KEY") or "").strip()
+    if not api_key:
+        print("Missing OPENAI_API_KEY", file=sys.stderr)
+        return 2
+
     out_dir = Path(args.out_dir).expanduser() if args.out_dir else default_out_dir()
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    prompts = [args.prompt] * count if args.prompt else pick_prompts(count)
-
     # Determine file extension based on output format
     if args.model.startswith("gpt-image") and args.output_format:
         file_ext = args.output_format
@@ -202,39 +257,33 @@ def main() -> int:
     items: list[dict] = []
     for idx, prompt in enumerate(prompts, start=1):
         print(f"[{idx}/{len(prompts)}] {prompt}")
-        res = request_images(
-            api_key,
-            prompt,
-            args.model,
-            size,
-            quality,
-            args.background,
-            args.output_format,
-            args.style,
-        )
-        data = res.get("data", [{}])[0]
-        image_b64 = data.get("b64_json")
-        image_url = data.get("url")
-        if not image_b64 and not image_url:
-            raise RuntimeError(f"Unexpected response: {json.dumps(res)[:400]}")
-
+        with profile_phase("request"):
+            res = request_images(
+                api_key,
+                prompt,
+                args.model,
+                size,
+                quality,
+                args.background,
+                args.output_format,
+                args.style,
+            )
         filename = f"{idx:03d}-{slugify(prompt)[:40]}.{file_ext}"
-        filepath = out_dir / filename
-        if image_b64:
-            filepath.write_bytes(base64.b64decode(image_b64))
-        else:
-            try:
-                urllib.request.urlretrieve(image_url, filepath)
-            except urllib.error.URLError as e:
-                raise RuntimeError(f"Failed to download image from {image_url}: {e}") from e
+        with profile_phase("save"):
+            save_image_result(res, out_dir / filename)
 
         items.append({"prompt": prompt, "file": filename})
 
-    (out_dir / "prompts.json").write_text(json.dumps(items, indent=2), encoding="utf-8")
-    write_gallery(out_dir, items)
+    with profile_phase("gallery"):
+        (out_dir / "prompts.json").write_text(json.dumps(items, indent=2), encoding="utf-8")
+        write_gallery(out_dir, items)
     print(f"\nWrote: {(out_dir / 'index.html').as_posix()}")
     return 0
 
 
 if __name__ == "__main__":
+    if os.environ.get("OPENCLAW_SKILL_PROFILE"):
+        sys.path.append(str(Path(__file__).resolve().parents[2] / "skill-creator" / "scripts"))
+        from skill_profile import profiled
+        main = profiled(main)
     raise SystemExit(main())
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = [
+#     "google-genai>=1.0.0",
+#     "pillow>=10.0.0",
+# ]
+# ///
+"""
+Shared local job runner for the image-generation skills.
+
+gen.py (OpenAI) and nano-banana-pro's generate_image.py (Gemini) submit jobs
+with --queue; this script drains the queue with per-provider concurrency
+limits and keeps one manifest + gallery for everything it produced.
+
+Usage:
+    python3 gen.py --prompt "a lobster astronaut" --count 4 --queue
+    uv run ../../nano-banana-pro/scripts/generate_image.py -p "a lobster astronaut" --queue
+    uv run image_jobs.py run [--limit openai=4] [--limit gemini=2] [--watch]
+    python3 image_jobs.py status
+
+Queue layout (default ~/.openclaw/image-jobs, override with OPENCLAW_IMAGE_JOBS_DIR):
+    pending/<id>.json   submitted, not yet picked up
+    running/<id>.json   claimed by the runner
+    done/<id>.json      finished; includes the output file
+    failed/<id>.json    finished with an error; resubmitting retries it
+    outputs/            generated images
+    manifest.json, index.html
+
+Job ids are a hash of the provider and its normalized parameters, so submitting
+an identical job again is a no-op while it is pending, running or done.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fcntl
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from pathlib import Path
+
+import gen
+
+NANO_BANANA_SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "nano-banana-pro" / "scripts"
+# Gemini jobs run on pool threads; only one of them sets up the import
+_NANO_BANANA_LOCK = threading.Lock()
+
+STATES = ("pending", "running", "done", "failed")
+DEFAULT_LIMITS = {"openai": 4, "gemini": 2}
+
+
+def jobs_root() -> Path:
+    override = os.environ.get("OPENCLAW_IMAGE_JOBS_DIR")
+    root = Path(override).expanduser() if override else Path.home() / ".openclaw" / "image-jobs"
+    for state in (*STATES, "outputs"):
+        (root / state).mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def job_id_for(provider: str, params: dict) -> str:
+    canonical = json.dumps({"provider": provider, "params": params}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def write_json_atomic(path: Path, payload: dict) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def submit_job(provider: str, params: dict, root: Path | None = None) -> tuple[str, str]:
+    """
+    Queue a job unless an identical one is already pending, running or done.
+
+    Returns (job_id, state) where state is "queued" for a new job or the state
+    of the existing identical job.
+    """
+    root = root or jobs_root()
+    job_id = job_id_for(provider, params)
+    for state in ("pending", "running", "done"):
+        if (root / state / f"{job_id}.json").exists():
+            return job_id, state
+
+    (root / "failed" / f"{job_id}.json").unlink(missing_ok=True)
+    job = {"id": job_id, "provider": provider, "params": params, "submitted_at": time.time()}
+    write_json_atomic(root / "pending" / f"{job_id}.json", job)
+    return job_id, "queued"
+
+
+def run_openai_job(job: dict, output_dir: Path) -> Path:
+    """Adapter for gen.py: one Images API request per job."""
+    api_key = (os.environ.get("OPENAI_API_KEY") or "").strip()
+    if not api_key:
+        raise RuntimeError("Missing OPENAI_API_KEY")
+
+    params = job["params"]
+    res = gen.request_images(
+        api_key,
+        params["prompt"],
+        params["model"],
+        params["size"],
+        params["quality"],
+        params.get("background", ""),
+        params.get("output_format", ""),
+        params.get("style", ""),
+    )
+    if params["model"].startswith("gpt-image") and params.get("output_format"):
+        file_ext = params["output_format"]
+    else:
+        file_ext = "png"
+    filepath = output_dir / f"{job['id']}-{gen.slugify(params['prompt'])[:40]}.{file_ext}"
+    gen.save_image_result(res, filepath)
+    return filepath
+
+
+def load_generate_image():
+    """Import nano-banana-pro's generate_image (once; later calls hit sys.modules)."""
+    with _NANO_BANANA_LOCK:
+        path = str(NANO_BANANA_SCRIPTS_DIR)
+        if path not in sys.path:
+            sys.path.insert(0, path)
+        try:
+            import generate_image
+        except ImportError as e:
+            raise RuntimeError(f"gemini jobs need the nano-banana-pro skill installed next to openai-image-gen ({e})") from e
+    return generate_image
+
+
+def run_gemini_job(job: dict, output_dir: Path) -> Path:
+    """Adapter for generate_image.py: one generate_content request per job."""
+    generate_image = load_generate_image()
+    from google.genai import types
+    from PIL import Image as PILImage
+
+    api_key = generate_image.get_api_key(None)
+    if not api_key:
+        raise RuntimeError("Missing GEMINI_API_KEY in the environment of image_jobs.py run")
+
+    params = job["params"]
+    client = generate_image.get_client(api_key)
+    with ExitStack() as stack:
+        input_images = [stack.enter_context(PILImage.open(path)) for path in params.get("input_images", [])]
+        contents = [*input_images, params["prompt"]] if input_images else params["prompt"]
+        response = client.models.generate_content(
+            model=generate_image.MODEL,
+            contents=contents,
+            config=types.GenerateContentConfig(
+                response_modalities=["TEXT", "IMAGE"],
+                image_config=types.ImageConfig(image_size=params["resolution"]),
+            ),
+        )
+
+    filepath = output_dir / f"{job['id']}-{gen.slugify(params['prompt'])[:40]}.png"
+    for part in response.parts or []:
+        if part.inline_data is not None:
+            generate_image.save_image(part.inline_data.data, filepath)
+            return filepath
+    raise RuntimeError("No image was generated in the response.")
+
+
+ADAPTERS = {"openai": run_openai_job, "gemini": run_gemini_job}
+
+
+def run_job(job: dict, root: Path) -> dict:
+    started = time.monotonic()
+    filepath = ADAPTERS[job["provider"]](job, root / "outputs")
+    return {
+        "file": filepath.relative_to(root).as_posix(),
+        "elapsed_s": round(time.monotonic() - started, 3),
+        "finished_at": time.time(),
+    }
+
+
+def load_jobs(root: Path, state: str) -> list[dict]:
+    jobs = []
+    for path in (root / state).glob("*.json"):
+        try:
+            jobs.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, json.JSONDecodeError):
+            continue
+    return sorted(jobs, key=lambda job: job.get("submitted_at", 0))
+
+
+def write_manifest(root: Path) -> None:
+    """Rebuild manifest.json and the index.html gallery from all finished jobs."""
+    done = sorted(load_jobs(root, "done"), key=lambda job: job.get("finished_at", 0))
+    write_json_atomic(root / "manifest.json", {"jobs": done})
+    items = [
+        {"prompt": f"[{job['provider']}] {job['params']['prompt']}", "file": job["file"]}
+        for job in done
+    ]
+    gen.write_gallery(root, items, title="image-jobs")
+
+
+def run_queue(root: Path, limits: dict[str, int], watch: bool = False, poll_interval: float = 1.0) -> int:
+    """
+    Drain the queue, running each provider's jobs on its own bounded pool.
+
+    All providers run side by side so a slow provider never blocks another.
+    Returns the number of jobs that failed.
+    """
+    # One runner per queue; anything left in running/ is from a crashed runner
+    lock = open(root / "runner.lock", "w")
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        print(f"Another runner is already draining {root}", file=sys.stderr)
+        lock.close()
+        return 1
+    for path in (root / "running").glob("*.json"):
+        os.replace(path, root / "pending" / path.name)
+
+    pools = {provider: ThreadPoolExecutor(max_workers=limit) for provider, limit in limits.items()}
+    in_flight = {}
+    failures = 0
+    try:
+        while True:
+            for job in load_jobs(root, "pending"):
+                pending_path = root / "pending" / f"{job['id']}.json"
+                running_path = root / "running" / f"{job['id']}.json"
+                if job["provider"] not in pools:
+                    job["error"] = f"Unknown provider '{job['provider']}'"
+                    write_json_atomic(root / "failed" / f"{job['id']}.json", job)
+                    pending_path.unlink(missing_ok=True)
+                    failures += 1
+                    continue
+                os.replace(pending_path, running_path)
+                in_flight[pools[job["provider"]].submit(run_job, job, root)] = job
+
+            if not in_flight:
+                if not watch:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            finished, _ = wait(in_flight, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            for future in finished:
+                job = in_flight.pop(future)
+                running_path = root / "running" / f"{job['id']}.json"
+                try:
+                    job.update(future.result())
+                    write_json_atomic(root / "done" / f"{job['id']}.json", job)
+                    print(f"done   {job['provider']:<6} {job['id']} {job['elapsed_s']:.1f}s {job['file']}")
+                except Exception as e:
+                    job["error"] = str(e)
+                    write_json_atomic(root / "failed" / f"{job['id']}.json", job)
+                    print(f"failed {job['provider']:<6} {job['id']} {e}", file=sys.stderr)
+                    failures += 1
+                running_path.unlink(missing_ok=True)
+            if finished:
+                write_manifest(root)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pool in pools.values():
+            pool.shutdown(wait=True, cancel_futures=True)
+        lock.close()
+    return failures
+
+
+def parse_limits(raw: list[str]) -> dict[str, int]:
+    limits = dict(DEFAULT_LIMITS)
+    for item in raw:
+        provider, _, value = item.partition("=")
+        if provider not in ADAPTERS or not value.isdigit() or int(value) < 1:
+            raise ValueError(f"Invalid --limit '{item}' (expected one of {', '.join(ADAPTERS)}=N with N >= 1)")
+        limits[provider] = int(value)
+    return limits
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Run queued image-generation jobs across providers.")
+    sub = ap.add_subparsers(dest="command", required=True)
+    run_ap = sub.add_parser("run", help="Drain the queue (and keep polling with --watch).")
+    run_ap.add_argument(
+        "--limit",
+        action="append",
+        default=[],
+        metavar="PROVIDER=N",
+        help="Max concurrent requests per provider (default: openai=4, gemini=2).",
+    )
+    run_ap.add_argument("--watch", action="store_true", help="Keep running and pick up newly submitted jobs.")
+    sub.add_parser("status", help="Show job counts per state.")
+    args = ap.parse_args(argv)
+
+    root = jobs_root()
+    if args.command == "status":
+        for state in STATES:
+            print(f"{state:<8} {len(list((root / state).glob('*.json')))}")
+        print(f"gallery  {(root / 'index.html').as_posix()}")
+        return 0
+
+    try:
+        limits = parse_limits(args.limit)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    failures = run_queue(root, limits, watch=args.watch)
+    if (root / "index.html").exists():
+        print(f"\nWrote: {(root / 'index.html').as_posix()}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Toolchain Benchmark - Times init_skill.py, quick_validate.py and package_skill.py on synthetic skill trees
+
+Usage:
+    python utils/benchmark_toolchain.py [--scales 10,100,1000] [--files 6] [--file-size 16384]
+                                        [--incompressible 0.3] [--repeat 3] [--output baseline.json]
+                                        [--compare old-baseline.json]
+
+Example:
+    python utils/benchmark_toolchain.py --scales 10,100 --output bench/baseline.json
+    python utils/benchmark_toolchain.py --compare bench/baseline.json
+
+For each scale (number of skills) a tree of generated skills is written to a
+temporary directory: a valid SKILL.md plus --files files split between
+compressible text (references/*.md) and random, incompressible bytes
+(assets/*.bin) according to --incompressible. Content is derived from --seed,
+so the same options always produce the same tree.
+
+Each phase runs the real command-line tool in a child process, so interpreter
+startup, imports and process pools are part of the measurement:
+
+    init              init_skill.py --manifest (one batch of <scale> skills)
+    validate          quick_validate.py --recursive --no-cache
+    validate_cached   quick_validate.py --recursive with a warm result cache
+    package           package_skill.py --all into an empty directory
+    package_cached    package_skill.py --all again (every archive up to date)
+
+Times are the best of --repeat runs; peak RSS is the largest resident set of
+the child (and the children it waited for) over all runs, as reported by
+wait4(). Archive sizes come from the index.json package_skill.py writes.
+
+The JSON report is the baseline: pass it back with --compare to print each
+phase's change and flag those slower than --tolerance.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPORT_VERSION = 1
+
+DEFAULT_SCALES = [10, 100, 1000]
+PHASES = ["init", "validate", "validate_cached", "package", "package_cached"]
+
+WORDS = (
+    "skill agent context workflow script reference asset template validate package archive "
+    "frontmatter description metadata resource install binary command output input file folder "
+    "markdown section example guide step option default value error warning result cache index"
+).split()
+# Generated once per run; compressible files are slices of it
+TEXT_CORPUS_BYTES = 1 << 20
+
+
+def text_corpus(rng):
+    """About TEXT_CORPUS_BYTES of word-salad markdown, compressible like real reference docs."""
+    lines = []
+    size = 0
+    while size < TEXT_CORPUS_BYTES:
+        if rng.random() < 0.05:
+            line = f"\n## {rng.choice(WORDS).capitalize()} {rng.choice(WORDS)}\n\n"
+        else:
+            line = " ".join(rng.choices(WORDS, k=rng.randint(6, 16))).capitalize() + ".\n"
+        lines.append(line)
+        size += len(line)
+    return "".join(lines).encode("utf-8")
+
+
+def generate_tree(root, skills, files, file_size, incompressible, seed=0):
+    """
+    Write a synthetic skills tree under root.
+
+    Args:
+        root: Directory to create the skills in
+        skills: Number of skills
+        files: Files per skill besides SKILL.md
+        file_size: Size of each file in bytes
+        incompressible: Fraction (0-1) of each skill's files that are random bytes
+        seed: Seed for all generated content
+
+    Returns:
+        Total bytes written
+    """
+    rng = random.Random(seed)
+    corpus = text_corpus(rng)
+    binary_files = round(files * incompressible)
+    total = 0
+    for number in range(1, skills + 1):
+        skill_name = f"bench-skill-{number:04d}"
+        skill_dir = Path(root) / skill_name
+        (skill_dir / "references").mkdir(parents=True)
+        if binary_files:
+            (skill_dir / "assets").mkdir()
+
+        links = []
+        for index in range(files):
+            if index < binary_files:
+                relpath = f"assets/blob-{index:02d}.bin"
+                data = rng.randbytes(file_size)
+            else:
+                relpath = f"references/doc-{index:02d}.md"
+                offset = rng.randrange(max(1, len(corpus) - file_size))
+                data = corpus[offset:offset + file_size]
+                links.append(relpath)
+            (skill_dir / relpath).write_bytes(data)
+            total += len(data)
+
+        skill_md = (
+            f"---\nname: {skill_name}\n"
+            f"description: Synthetic skill {number} for benchmarking the skill toolchain. "
+            f"Use when measuring validation and packaging speed.\n---\n\n"
+            f"# Bench Skill {number:04d}\n\n## Usage\n\n"
+            + "".join(f"- See [{Path(link).stem}]({link})\n" for link in links)
+        )
+        (skill_dir / "SKILL.md").write_text(skill_md, encoding="utf-8")
+        total += len(skill_md)
+    return total
+
+
+def run_tool(args, env):
+    """
+    Run a toolchain script to completion.
+
+    Returns:
+        (wall seconds, peak RSS in KB, exit status)
+    """
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, *map(str, args)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    # wait4 reports this child's own rusage, unlike RUSAGE_CHILDREN which accumulates over all children
+    _, status, usage = os.wait4(process.pid, 0)
+    seconds = time.perf_counter() - started
+    process.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is in KB on Linux, bytes on macOS
+    peak_kb = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return seconds, peak_kb, process.returncode
+
+
+def time_phase(name, repeat, prepare, args, env):
+    """Best wall time and largest peak RSS of repeat runs; prepare() resets state before each run."""
+    best = None
+    peak_kb = 0
+    for _ in range(repeat):
+        prepare()
+        seconds, run_peak_kb, status = run_tool(args, env)
+        if status != 0:
+            print(f"[WARN] {name} exited with status {status}")
+        best = seconds if best is None else min(best, seconds)
+        peak_kb = max(peak_kb, run_peak_kb)
+    return {"seconds": round(best, 4), "peak_rss_kb": peak_kb}
+
+
+def benchmark_scale(workdir, skills, files, file_size, incompressible, seed, repeat, method):
+    """Run every phase against a freshly generated tree with the given number of skills."""
+    base = Path(workdir) / f"scale-{skills}"
+    tree = base / "skills"
+    tree.mkdir(parents=True)
+    print(f"Generating {skills} skill(s) with {files} file(s) of {file_size} bytes...")
+    tree_bytes = generate_tree(tree, skills, files, file_size, incompressible, seed)
+
+    cache = base / "validate-cache.json"
+    dist = base / "dist"
+    init_dir = base / "init"
+    manifest = base / "manifest.json"
+    manifest.write_text(
+        json.dumps([
+            {"name": f"new-skill-{number:04d}", "resources": ["scripts", "references"], "examples": True}
+            for number in range(1, skills + 1)
+        ]),
+        encoding="utf-8",
+    )
+    env = dict(os.environ, OPENCLAW_SKILL_VALIDATE_CACHE=str(cache), PYTHONDONTWRITEBYTECODE="1")
+
+    def clear(*paths):
+        def prepare():
+            for path in paths:
+                if path.is_dir():
+                    shutil.rmtree(path)
+                elif path.exists():
+                    path.unlink()
+        return prepare
+
+    def keep():
+        pass
+
+    validate = SCRIPTS_DIR / "quick_validate.py"
+    package = SCRIPTS_DIR / "package_skill.py"
+    phases = {}
+    print(f"Timing {skills} skill(s)...")
+    phases["init"] = time_phase(
+        "init", repeat, clear(init_dir), [SCRIPTS_DIR / "init_skill.py", "--manifest", manifest, "--path", init_dir], env
+    )
+    phases["validate"] = time_phase(
+        "validate", repeat, keep, [validate, "--recursive", tree, "--json", "--no-cache"], env
+    )
+    # One untimed run fills the cache
+    run_tool([validate, "--recursive", tree, "--json"], env)
+    phases["validate_cached"] = time_phase(
+        "validate_cached", repeat, keep, [validate, "--recursive", tree, "--json"], env
+    )
+    package_args = [package, "--all", tree, dist, "--method", method]
+    phases["package"] = time_phase("package", repeat, clear(dist), package_args, env)
+    phases["package_cached"] = time_phase("package_cached", repeat, keep, package_args, env)
+
+    try:
+        index = json.loads((dist / "index.json").read_text(encoding="utf-8"))
+        archive_bytes = sum(entry["size"] for entry in index["skills"])
+        packaged = len(index["skills"])
+    except (OSError, ValueError, KeyError):
+        archive_bytes = packaged = None
+
+    return {
+        "skills": skills,
+        "tree_bytes": tree_bytes,
+        "archive_bytes": archive_bytes,
+        "compression_ratio": round(archive_bytes / tree_bytes, 4) if archive_bytes else None,
+        "packaged": packaged,
+        "phases": phases,
+    }
+
+
+def compare(report, baseline, tolerance):
+    """Print each phase's change against baseline; returns the number of regressions."""
+    previous = {result["skills"]: result for result in baseline.get("results", [])}
+    regressions = 0
+    print(f"\nCompared with baseline from {baseline.get('created', 'unknown date')}:")
+    for result in report["results"]:
+        old = previous.get(result["skills"])
+        if not old:
+            print(f"  {result['skills']:>5} skills: not in baseline")
+            continue
+        for phase in PHASES:
+            new_phase, old_phase = result["phases"].get(phase), old["phases"].get(phase)
+            if not new_phase or not old_phase or not old_phase["seconds"]:
+                continue
+            change = new_phase["seconds"] / old_phase["seconds"] - 1
+            rss_change = new_phase["peak_rss_kb"] / max(1, old_phase["peak_rss_kb"]) - 1
+            slower = change > tolerance
+            regressions += slower
+            print(
+                f"  {'[WARN]' if slower else '[OK]  '} {result['skills']:>5} skills {phase:<16} "
+                f"{old_phase['seconds']:.3f}s -> {new_phase['seconds']:.3f}s ({change:+.0%}), "
+                f"peak RSS {rss_change:+.0%}"
+            )
+        if old.get("archive_bytes") and result.get("archive_bytes"):
+            size_change = result["archive_bytes"] / old["archive_bytes"] - 1
+            print(f"         {result['skills']:>5} skills archive size {size_change:+.1%}")
+    return regressions
+
+
+def print_report(report):
+    print(f"\n{'skills':>6}  {'phase':<16} {'seconds':>9}  {'peak RSS':>9}")
+    for result in report["results"]:
+        for phase in PHASES:
+            timing = result["phases"][phase]
+            print(
+                f"{result['skills']:>6}  {phase:<16} {timing['seconds']:>9.3f}  "
+                f"{timing['peak_rss_kb'] / 1024:>7.1f} MB"
+            )
+        if result["archive_bytes"]:
+            print(
+                f"{'':>6}  archives: {result['archive_bytes'] / 1024:.1f} KB from "
+                f"{result['tree_bytes'] / 1024:.1f} KB of files (ratio {result['compression_ratio']:.2f})"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark init_skill.py, quick_validate.py and package_skill.py on synthetic skill trees.",
+    )
+    parser.add_argument(
+        "--scales",
+        default=",".join(map(str, DEFAULT_SCALES)),
+        help="Comma-separated skill counts to benchmark (default: 10,100,1000)",
+    )
+    parser.add_argument("--files", type=int, default=6, help="Files per skill besides SKILL.md (default: 6)")
+    parser.add_argument("--file-size", type=int, default=16 * 1024, help="Bytes per file (default: 16384)")
+    parser.add_argument(
+        "--incompressible",
+        type=float,
+        default=0.3,
+        help="Fraction of files that are random bytes instead of text (default: 0.3)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for generated content (default: 0)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per phase; the fastest counts (default: 3)")
+    parser.add_argument(
+        "--method",
+        default="deflate",
+        help="Compression method passed to package_skill.py (default: deflate)",
+    )
+    parser.add_argument("--output", help="Write the JSON report (the new baseline) to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Earlier JSON report to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="With --compare: slowdown (0.2 = 20%%) above which a phase counts as a regression",
+    )
+    parser.add_argument("--workdir", help="Where to generate the trees (default: a temporary directory)")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated trees and archives")
+    args = parser.parse_args()
+
+    try:
+        scales = [int(item) for item in args.scales.split(",") if item.strip()]
+    except ValueError:
+        parser.error("--scales must be a comma-separated list of integers")
+    if not scales or min(scales) < 1:
+        parser.error("--scales needs at least one positive skill count")
+    if not 0 <= args.incompressible <= 1:
+        parser.error("--incompressible must be between 0 and 1")
+    if args.files < 0 or args.file_size < 0 or args.repeat < 1:
+        parser.error("--files and --file-size must not be negative, --repeat must be at least 1")
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Could not read baseline: {e}")
+            sys.exit(1)
+
+    if args.workdir:
+        workdir = Path(args.workdir).resolve()
+        workdir.mkdir(parents=True, exist_ok=True)
+        workdir = Path(tempfile.mkdtemp(prefix="skill-bench-", dir=workdir))
+    else:
+        workdir = Path(tempfile.mkdtemp(prefix="skill-bench-"))
+
+    report = {
+        "version": REPORT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "config": {
+            "files": args.files,
+            "file_size": args.file_size,
+            "incompressible": args.incompressible,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "method": args.method,
+        },
+        "results": [],
+    }
+    try:
+        for skills in scales:
+            report["results"].append(
+                benchmark_scale(
+                    workdir, skills, args.files, args.file_size, args.incompressible, args.seed, args.repeat, args.method
+                )
+            )
+    finally:
+        if args.keep:
+            print(f"Generated trees kept in {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print_report(report)
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\n[OK] Report written to {output}")
+    regressions = compare(report, baseline, args.tolerance) if baseline else 0
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Skill Catalog Builder - Indexes every skill under a directory into one file
+
+Usage:
+    python utils/build_catalog.py <skills-root> [--output catalog.json] [--rebuild] [--print-path]
+
+Example:
+    python utils/build_catalog.py skills
+    python utils/build_catalog.py skills --output dist/skills-catalog.json
+
+The catalog is a single compact JSON file holding, for each skill, its parsed
+frontmatter (name, description, metadata such as metadata.openclaw requires,
+os and install), validation result, and the files it would be packaged with
+(size, mtime, SHA-256). Consumers read it with load_catalog() instead of
+opening and parsing every SKILL.md.
+
+By default the catalog is kept in ~/.openclaw/cache/skill-catalog/ (one file
+per skills root, see default_catalog_path()) rather than inside the skills
+tree, which is usually under version control; --output writes it elsewhere.
+
+Updates are incremental: files whose size and mtime match the previous
+catalog keep their recorded hash, and a skill whose SKILL.md hash is
+unchanged is not re-parsed. Only new or modified files are read.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from package_skill import MANIFEST_NAME, IgnoreRules, hash_file, iter_skill_files
+from quick_validate import (
+    RACY_WINDOW_NS,
+    discover_skills,
+    load_frontmatter,
+    read_frontmatter_block,
+    root_cache_path,
+    rules_hash,
+    validate_frontmatter_text,
+)
+
+CATALOG_VERSION = 1
+
+
+def default_catalog_path(root):
+    return root_cache_path("skill-catalog", root)
+
+
+def load_catalog(path):
+    """Return the catalog at path, or None if it is missing or unreadable."""
+    try:
+        catalog = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(catalog, dict) or catalog.get("version") != CATALOG_VERSION:
+        return None
+    return catalog
+
+
+def scan_files(skill_path, previous_files, built_ns, pool):
+    """
+    List the packaged files of a skill with size, mtime_ns and SHA-256.
+
+    Hashes are reused from previous_files when size and mtime are unchanged
+    and the file was not modified just before the previous build.
+    """
+    rules = IgnoreRules.for_skill(skill_path)
+    files = {}
+    to_hash = []
+    for relpath, file_path in sorted(iter_skill_files(skill_path, rules)):
+        if relpath == MANIFEST_NAME:
+            continue
+        st = file_path.stat()
+        record = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        old = previous_files.get(relpath)
+        if (
+            old
+            and old["size"] == st.st_size
+            and old["mtime_ns"] == st.st_mtime_ns
+            and st.st_mtime_ns < built_ns - RACY_WINDOW_NS
+        ):
+            record["sha256"] = old["sha256"]
+        else:
+            to_hash.append((relpath, file_path))
+        files[relpath] = record
+
+    for (relpath, _), sha256 in zip(to_hash, pool.map(hash_file, [path for _, path in to_hash])):
+        files[relpath]["sha256"] = sha256
+    return files, len(to_hash)
+
+
+def describe_skill(skill_md):
+    """Parsed frontmatter fields and validation result for a SKILL.md."""
+    text, error = read_frontmatter_block(skill_md)
+    if error:
+        return {"name": None, "description": None, "metadata": None, "valid": False, "message": error}
+    frontmatter, error = load_frontmatter(text)
+    if error:
+        return {"name": None, "description": None, "metadata": None, "valid": False, "message": error}
+    valid, message = validate_frontmatter_text(text)
+    return {
+        "name": frontmatter.get("name"),
+        "description": frontmatter.get("description"),
+        "metadata": frontmatter.get("metadata"),
+        "valid": valid,
+        "message": message,
+    }
+
+
+def build_catalog(root, output=None, rebuild=False, workers=None):
+    """
+    Build or update the catalog of every skill under root.
+
+    Args:
+        root: Directory to search for skills (folders containing SKILL.md)
+        output: Catalog path (defaults to default_catalog_path(root))
+        rebuild: Ignore the existing catalog and re-read everything
+        workers: Hashing threads (defaults to the CPU count)
+
+    Returns:
+        Path to the catalog, or None if error
+    """
+    root = Path(root).resolve()
+    if not root.is_dir():
+        print(f"[ERROR] Skills root not found: {root}")
+        return None
+    output = Path(output).resolve() if output else default_catalog_path(root)
+
+    rules = rules_hash()
+    previous = None if rebuild else load_catalog(output)
+    previous_skills = previous["skills"] if previous else {}
+    # Cached validation results are only good for the rules they were made with
+    reuse_parsed = bool(previous) and previous.get("rules") == rules
+    built_ns = previous["built_ns"] if previous else 0
+
+    skills = {}
+    hashed = reparsed = 0
+    started_ns = time.time_ns()
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        for skill_path in discover_skills(root):
+            key = skill_path.relative_to(root).as_posix()
+            old = previous_skills.get(key, {})
+            files, count = scan_files(skill_path, old.get("files", {}), built_ns, pool)
+            hashed += count
+
+            if "SKILL.md" in files:
+                skill_md_sha256 = files["SKILL.md"]["sha256"]
+            else:
+                skill_md_sha256 = hash_file(skill_path / "SKILL.md")
+            if reuse_parsed and old.get("skill_md_sha256") == skill_md_sha256:
+                entry = {field: old[field] for field in ("name", "description", "metadata", "valid", "message")}
+            else:
+                entry = describe_skill(skill_path / "SKILL.md")
+                reparsed += 1
+            entry["skill_md_sha256"] = skill_md_sha256
+            entry["files"] = files
+            # Identifies this exact content, for cache keys and change detection
+            entry["content_sha256"] = hashlib.sha256(
+                "".join(f"{relpath}\0{record['sha256']}\n" for relpath, record in files.items()).encode("utf-8")
+            ).hexdigest()
+            skills[key] = entry
+
+    catalog = {
+        "version": CATALOG_VERSION,
+        "rules": rules,
+        "built_ns": started_ns,
+        "skills": skills,
+    }
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(catalog, separators=(",", ":"), sort_keys=True), encoding="utf-8")
+    os.replace(tmp, output)
+
+    removed = len(set(previous_skills) - set(skills))
+    print(
+        f"[OK] Cataloged {len(skills)} skill(s): {reparsed} parsed, {len(skills) - reparsed} unchanged, "
+        f"{removed} removed, {hashed} file(s) hashed -> {output}"
+    )
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build an index of every skill's metadata, files and content hashes.",
+    )
+    parser.add_argument("root", help="Directory containing the skills")
+    parser.add_argument("--output", help="Catalog path (default: a per-root file in ~/.openclaw/cache/skill-catalog)")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the existing catalog and re-read everything")
+    parser.add_argument("--print-path", action="store_true", help="Print the default catalog path for root and exit")
+    args = parser.parse_args()
+
+    if args.print_path:
+        print(default_catalog_path(args.root))
+        return
+
+    result = build_catalog(args.root, args.output, rebuild=args.rebuild)
+    sys.exit(0 if result else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Context Cost Profiler - Estimates how many tokens each skill adds to the agent context
+
+Usage:
+    python utils/context_cost.py <skills-root> [--top 10] [--config budgets.json] [--json]
+
+Example:
+    python utils/context_cost.py skills
+    python utils/context_cost.py skills --top 20 --json
+
+Costs follow the three loading levels of a skill:
+    metadata    name + description, always in context
+    body        the rest of SKILL.md, loaded when the skill triggers
+    references  text files SKILL.md links to or keeps under references/,
+                loaded on demand
+
+Token counts come from a local approximation of BPE tokenizers (word pieces,
+digit groups, punctuation runs, non-ASCII characters), so they are estimates
+meant for comparing skills and sections, not exact billing numbers.
+
+Budgets are read from <skills-root>/.skill-budgets.json (or --config) and
+default to the limits in SKILL.md's progressive disclosure guidance:
+
+    {
+      "metadata": 200,
+      "body": 6500,
+      "section": 2000,
+      "references": null,
+      "skills": {"my-big-skill": {"body": 9000}}
+    }
+
+Every exceeded budget is reported as a warning.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from urllib.parse import unquote
+
+from quick_validate import FENCE_RE, URL_SCHEME_RE, discover_skills, markdown_links, parse_frontmatter
+
+BUDGETS_NAME = ".skill-budgets.json"
+DEFAULT_BUDGETS = {"metadata": 200, "body": 6500, "section": 2000, "references": None}
+REFERENCE_SUFFIXES = {".md", ".markdown", ".txt", ".rst", ".json", ".yaml", ".yml", ".csv", ".html", ".xml"}
+
+# Leading whitespace attaches to the following piece, as in BPE pre-tokenizers
+TOKEN_PIECE_RE = re.compile(r" ?[A-Za-z]+| ?[0-9]{1,3}| ?[^\sA-Za-z0-9\x80-\U0010ffff]+|[\x80-\U0010ffff]|\s+")
+# Average characters per token for long words and punctuation runs
+CHARS_PER_WORD_TOKEN = 6
+CHARS_PER_SYMBOL_TOKEN = 2
+
+
+def estimate_tokens(text):
+    """Approximate BPE token count of text."""
+    count = 0
+    for piece in TOKEN_PIECE_RE.findall(text):
+        stripped = piece.lstrip(" ")
+        if not stripped:
+            # Runs of spaces/newlines: roughly one token per line break or indent block
+            count += piece.count("\n") or 1
+        elif stripped[0].isalpha() and stripped.isascii():
+            count += math.ceil(len(stripped) / CHARS_PER_WORD_TOKEN)
+        elif stripped[0].isdigit():
+            count += 1
+        elif not stripped.isascii():
+            count += 1
+        else:
+            count += math.ceil(len(stripped) / CHARS_PER_SYMBOL_TOKEN)
+    return count
+
+
+def split_sections(body):
+    """Split a markdown body into (heading, text) sections, ignoring headings in fenced code."""
+    sections = [["(preamble)", []]]
+    in_fence = False
+    for line in body.splitlines(keepends=True):
+        if FENCE_RE.match(line.lstrip()):
+            in_fence = not in_fence
+        elif not in_fence and line.startswith("#"):
+            sections.append([line.strip(), []])
+        sections[-1][1].append(line)
+    return [(heading, "".join(lines)) for heading, lines in sections if "".join(lines).strip()]
+
+
+def reference_files(skill_path, content):
+    """Text files under references/ plus any other text files SKILL.md links to."""
+    skill_root = Path(skill_path).resolve()
+    found = set()
+    references_dir = skill_root / "references"
+    if references_dir.is_dir():
+        found.update(path for path in references_dir.rglob("*") if path.is_file())
+    for target in markdown_links(content):
+        if URL_SCHEME_RE.match(target) or target.startswith(("#", "/")):
+            continue
+        path = (skill_root / unquote(target.split("#", 1)[0])).resolve()
+        if path.is_file() and path.is_relative_to(skill_root) and path.name != "SKILL.md":
+            found.add(path)
+    return sorted(path for path in found if path.suffix.lower() in REFERENCE_SUFFIXES)
+
+
+def profile_skill(skill_path):
+    """Token estimates for one skill: metadata, body, per-section and per-reference."""
+    skill_path = Path(skill_path)
+    try:
+        content = (skill_path / "SKILL.md").read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        content = ""
+    frontmatter, _ = parse_frontmatter(content)
+    frontmatter = frontmatter or {}
+    match = re.match(r"^---\n.*?\n---[^\n]*\n?", content, re.DOTALL)
+    body = content[match.end():] if match else content
+
+    references = {}
+    for path in reference_files(skill_path, content):
+        try:
+            references[path.relative_to(skill_path.resolve()).as_posix()] = estimate_tokens(
+                path.read_text(encoding="utf-8")
+            )
+        except (OSError, UnicodeDecodeError):
+            continue
+
+    metadata_text = f"{frontmatter.get('name', '')}: {frontmatter.get('description', '')}"
+    return {
+        "skill": skill_path.name,
+        "metadata": estimate_tokens(metadata_text),
+        "body": estimate_tokens(body),
+        "sections": [(heading, estimate_tokens(text)) for heading, text in split_sections(body)],
+        "references": references,
+    }
+
+
+def load_budgets(path, required=False):
+    """
+    Default budgets overlaid with the config file at path.
+
+    A missing file is only an error when required (an explicit --config);
+    raises ValueError for a file that is not a JSON object or has a budget
+    that is not a number or null.
+    """
+    budgets = dict(DEFAULT_BUDGETS, skills={})
+    if not path or (not required and not Path(path).is_file()):
+        return budgets
+    config = json.loads(Path(path).read_text(encoding="utf-8"))
+    skills = config.get("skills", {}) if isinstance(config, dict) else None
+    if not isinstance(skills, dict) or not all(isinstance(limits, dict) for limits in skills.values()):
+        raise ValueError(f"{path} must be a JSON object whose optional 'skills' maps names to objects")
+    limits = [(key, value) for key, value in config.items() if key != "skills"]
+    limits += [(f"skills.{name}.{key}", value) for name, overrides in skills.items() for key, value in overrides.items()]
+    for key, value in limits:
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise ValueError(f"{path}: budget '{key}' must be a number or null, not {json.dumps(value)}")
+    budgets.update(config)
+    return budgets
+
+
+def budget_warnings(profile, budgets):
+    limits = dict(budgets)
+    limits.update(budgets.get("skills", {}).get(profile["skill"], {}))
+    warnings = []
+    reference_total = sum(profile["references"].values())
+    for level, used in (("metadata", profile["metadata"]), ("body", profile["body"]), ("references", reference_total)):
+        if limits.get(level) is not None and used > limits[level]:
+            warnings.append(f"{profile['skill']}: {level} ~{used} tokens exceeds budget of {limits[level]}")
+    if limits.get("section") is not None:
+        for heading, used in profile["sections"]:
+            if used > limits["section"]:
+                warnings.append(
+                    f"{profile['skill']}: section '{heading}' ~{used} tokens exceeds budget of {limits['section']}"
+                )
+    return warnings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Estimate the context cost (tokens) of every skill under a directory.",
+    )
+    parser.add_argument("root", help="Directory containing the skills")
+    parser.add_argument("--top", type=int, default=10, help="How many skills and sections to list (default: 10)")
+    parser.add_argument("--config", help=f"Budget config (default: <root>/{BUDGETS_NAME} if present)")
+    parser.add_argument("--jobs", type=int, help="Processes to use (defaults to the CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print all profiles and warnings as JSON")
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    if not root.is_dir():
+        print(f"[ERROR] Skills root not found: {root}")
+        sys.exit(1)
+    try:
+        budgets = load_budgets(args.config or root / BUDGETS_NAME, required=bool(args.config))
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Could not read budget config: {e}")
+        sys.exit(1)
+
+    skills = discover_skills(root)
+    with ProcessPoolExecutor(max_workers=args.jobs or os.cpu_count() or 1) as pool:
+        profiles = list(pool.map(profile_skill, skills, chunksize=4))
+    warnings = [warning for profile in profiles for warning in budget_warnings(profile, budgets)]
+
+    if args.json:
+        print(json.dumps({"skills": profiles, "warnings": warnings}, indent=2))
+        return
+
+    print(f"Heaviest skills (estimated tokens, {len(profiles)} skills):")
+    print(f"  {'metadata':>8}  {'body':>7}  {'refs':>7}  skill")
+    for profile in sorted(profiles, key=lambda profile: profile["body"], reverse=True)[:args.top]:
+        reference_total = sum(profile["references"].values())
+        print(f"  {profile['metadata']:>8}  {profile['body']:>7}  {reference_total:>7}  {profile['skill']}")
+    always_loaded = sum(profile["metadata"] for profile in profiles)
+    print(f"\n  Always in context (all metadata): ~{always_loaded} tokens")
+
+    sections = sorted(
+        ((used, profile["skill"], heading) for profile in profiles for heading, used in profile["sections"]),
+        reverse=True,
+    )
+    print("\nHeaviest sections:")
+    for used, skill, heading in sections[:args.top]:
+        print(f"  {used:>7}  {skill}: {heading}")
+
+    if warnings:
+        print()
+        for warning in warnings:
+            print(f"[WARN] {warning}")
+    else:
+        print("\n[OK] All skills are within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,21 +4,53 @@ Skill Initializer - Creates a new skill from template
 
 Usage:
     init_skill.py <skill-name> --path <path> [--resources scripts,references,assets] [--examples]
+    init_skill.py --manifest <skills.yaml|skills.json> --path <path>
+    init_skill.py <skill-name> --path <path> --from <existing-skill> [--hardlink]
 
 Examples:
     init_skill.py my-new-skill --path skills/public
     init_skill.py my-new-skill --path skills/public --resources scripts,references
     init_skill.py my-api-helper --path skills/private --resources scripts --examples
     init_skill.py custom-skill --path /custom/location
+    init_skill.py --manifest new-skills.yaml --path skills/public
+    init_skill.py pdf-tools-lite --path skills/public --from skills/public/pdf-tools
+
+A manifest is a JSON or YAML list (optionally under a "skills" key) of skill
+names or entries like:
+
+    - name: pdf-tools
+      resources: [scripts, references]
+      examples: true
+    - name: slack-notes
+
+The whole batch is built in a temporary directory next to the destination and
+only renamed into place once every skill was written, so a failed batch leaves
+no partial skill folders. The new skills are validated at the end.
+
+--from forks an existing skill instead of starting from the template: its
+files are reflinked (copy-on-write clones, on filesystems such as Btrfs and
+XFS) so even large assets/ cost no extra disk, falling back to a plain copy.
+With --hardlink, files are hardlinked where reflinks are unavailable; the
+fork then shares those files with the original, so edit them only by
+replacing them. SKILL.md is always rewritten with the new name and title.
 """
 
 import argparse
+import json
+import os
 import re
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
+from package_skill import DEFAULT_IGNORE_PATTERNS, MANIFEST_NAME, IgnoreRules, format_size, iter_skill_files
+from quick_validate import FENCE_RE, validate_skills
+
 MAX_SKILL_NAME_LENGTH = 64
 ALLOWED_RESOURCES = {"scripts", "references", "assets"}
+# _IOW(0x94, 9, int) from linux/fs.h: share src's extents with dst (copy-on-write)
+FICLONE = 0x40049409
 
 SKILL_TEMPLATE = """---
 name: {skill_name}
@@ -224,7 +256,8 @@ def parse_resources(raw_resources):
     return deduped
 
 
-def create_resource_dirs(skill_dir, skill_name, skill_title, resources, include_examples):
+def create_resource_dirs(skill_dir, skill_name, skill_title, resources, include_examples, quiet=False):
+    log = (lambda message: None) if quiet else print
     for resource in resources:
         resource_dir = skill_dir / resource
         resource_dir.mkdir(exist_ok=True)
@@ -233,23 +266,23 @@ def create_resource_dirs(skill_dir, skill_name, skill_title, resources, include_
                 example_script = resource_dir / "example.py"
                 example_script.write_text(EXAMPLE_SCRIPT.format(skill_name=skill_name))
                 example_script.chmod(0o755)
-                print("[OK] Created scripts/example.py")
+                log("[OK] Created scripts/example.py")
             else:
-                print("[OK] Created scripts/")
+                log("[OK] Created scripts/")
         elif resource == "references":
             if include_examples:
                 example_reference = resource_dir / "api_reference.md"
                 example_reference.write_text(EXAMPLE_REFERENCE.format(skill_title=skill_title))
-                print("[OK] Created references/api_reference.md")
+                log("[OK] Created references/api_reference.md")
             else:
-                print("[OK] Created references/")
+                log("[OK] Created references/")
         elif resource == "assets":
             if include_examples:
                 example_asset = resource_dir / "example_asset.txt"
                 example_asset.write_text(EXAMPLE_ASSET)
-                print("[OK] Created assets/example_asset.txt")
+                log("[OK] Created assets/example_asset.txt")
             else:
-                print("[OK] Created assets/")
+                log("[OK] Created assets/")
 
 
 def init_skill(skill_name, path, resources, include_examples):
@@ -317,11 +350,274 @@ def init_skill(skill_name, path, resources, include_examples):
     return skill_dir
 
 
+def load_manifest(manifest_path):
+    """
+    Read a bulk manifest and check every entry before anything is written.
+
+    Returns:
+        List of (skill_name, resources, include_examples), or None if error
+    """
+    manifest_path = Path(manifest_path)
+    try:
+        text = manifest_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"[ERROR] Could not read manifest: {e}")
+        return None
+    try:
+        if manifest_path.suffix.lower() in (".yaml", ".yml"):
+            import yaml
+
+            data = yaml.safe_load(text)
+        else:
+            data = json.loads(text)
+    except ImportError:
+        print("[ERROR] YAML manifests need PyYAML (pip install pyyaml); use a .json manifest instead.")
+        return None
+    except ValueError as e:
+        print(f"[ERROR] Invalid manifest: {e}")
+        return None
+    if isinstance(data, dict):
+        data = data.get("skills")
+    if not isinstance(data, list) or not data:
+        print("[ERROR] Manifest must be a non-empty list of skills (or a mapping with a 'skills' list).")
+        return None
+
+    batch = []
+    errors = []
+    seen = set()
+    for index, entry in enumerate(data, 1):
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        if not isinstance(entry, dict) or not isinstance(entry.get("name"), str):
+            errors.append(f"entry {index}: expected a skill name or a mapping with a 'name'")
+            continue
+        skill_name = normalize_skill_name(entry["name"])
+        if not skill_name:
+            errors.append(f"entry {index}: skill name must include at least one letter or digit")
+            continue
+        if len(skill_name) > MAX_SKILL_NAME_LENGTH:
+            errors.append(f"{skill_name}: name is longer than {MAX_SKILL_NAME_LENGTH} characters")
+            continue
+        if skill_name in seen:
+            errors.append(f"{skill_name}: listed more than once")
+            continue
+        seen.add(skill_name)
+
+        raw_resources = entry.get("resources") or []
+        if isinstance(raw_resources, str):
+            raw_resources = raw_resources.split(",")
+        resources = list(dict.fromkeys(str(item).strip() for item in raw_resources if str(item).strip()))
+        invalid = sorted(set(resources) - ALLOWED_RESOURCES)
+        if invalid:
+            errors.append(f"{skill_name}: unknown resource type(s): {', '.join(invalid)}")
+            continue
+        include_examples = bool(entry.get("examples", False))
+        if include_examples and not resources:
+            errors.append(f"{skill_name}: examples requires resources to be set")
+            continue
+        batch.append((skill_name, resources, include_examples))
+
+    if errors:
+        print(f"[ERROR] Manifest has {len(errors)} problem(s):")
+        for error in errors:
+            print(f"   {error}")
+        return None
+    return batch
+
+
+def init_skills(batch, path):
+    """
+    Create every skill in batch under path, all or nothing.
+
+    Args:
+        batch: List of (skill_name, resources, include_examples) from load_manifest
+        path: Directory the skill directories are created in
+
+    Returns:
+        List of created skill directories, or None if error
+    """
+    path = Path(path).resolve()
+    existing = [skill_name for skill_name, _, _ in batch if (path / skill_name).exists()]
+    if existing:
+        print(f"[ERROR] Skill directories already exist in {path}: {', '.join(existing)}")
+        return None
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+        # Same filesystem as the destination, so moving each skill into place is a rename
+        staging = Path(tempfile.mkdtemp(prefix=".init-skill-", dir=path))
+    except OSError as e:
+        print(f"[ERROR] Error creating directory: {e}")
+        return None
+
+    created = []
+    try:
+        for skill_name, resources, include_examples in batch:
+            skill_title = title_case_skill_name(skill_name)
+            skill_dir = staging / skill_name
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text(
+                SKILL_TEMPLATE.format(skill_name=skill_name, skill_title=skill_title)
+            )
+            create_resource_dirs(skill_dir, skill_name, skill_title, resources, include_examples, quiet=True)
+        for skill_name, _, _ in batch:
+            destination = path / skill_name
+            if destination.exists():
+                raise FileExistsError(f"Skill directory appeared during the batch: {destination}")
+            os.rename(staging / skill_name, destination)
+            created.append(skill_name)
+    except OSError as e:
+        print(f"[ERROR] Error creating skills, nothing was kept: {e}")
+        # Move back whatever already went live so the cleanup below removes it too
+        for skill_name in created:
+            try:
+                os.rename(path / skill_name, staging / skill_name)
+            except OSError:
+                shutil.rmtree(path / skill_name, ignore_errors=True)
+        return None
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    for skill_name, resources, include_examples in batch:
+        details = ", ".join(resources) if resources else "no resources"
+        if include_examples:
+            details += ", with examples"
+        print(f"[OK] Created {skill_name} ({details})")
+    return [path / skill_name for skill_name in created]
+
+
+def clone_file(src, dst, allow_hardlink=False):
+    """
+    Copy src to dst as cheaply as the filesystem allows.
+
+    Returns:
+        "reflink", "hardlink" or "copy"
+    """
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        try:
+            with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return "reflink"
+        except OSError:
+            # Not supported here (or across filesystems); drop the empty file left behind
+            Path(dst).unlink(missing_ok=True)
+    if allow_hardlink:
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+def rename_skill_md(content, skill_name, skill_title):
+    """Set the frontmatter name and the first top-level heading of a SKILL.md to the new skill."""
+    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
+    if match:
+        block = match.group(1)
+        if re.search(r"^name:", block, re.MULTILINE):
+            block = re.sub(r"^name:.*$", lambda _: f"name: {skill_name}", block, count=1, flags=re.MULTILINE)
+        else:
+            block = f"name: {skill_name}\n{block}"
+        content = f"---\n{block}\n---{content[match.end():]}"
+        body_start = len(block) + 8
+    else:
+        body_start = 0
+
+    lines = content[body_start:].splitlines(keepends=True)
+    in_fence = False
+    for index, line in enumerate(lines):
+        if FENCE_RE.match(line.lstrip()):
+            in_fence = not in_fence
+        elif not in_fence and line.startswith("# "):
+            lines[index] = f"# {skill_title}\n"
+            break
+    return content[:body_start] + "".join(lines)
+
+
+def clone_skill(source, skill_name, path, allow_hardlink=False):
+    """
+    Create a new skill as a copy of an existing one.
+
+    Args:
+        source: Existing skill directory (containing SKILL.md)
+        skill_name: Name of the new skill
+        path: Path where the skill directory should be created
+        allow_hardlink: Hardlink files when reflinks are not supported
+
+    Returns:
+        Path to created skill directory, or None if error
+    """
+    source = Path(source).resolve()
+    skill_md = source / "SKILL.md"
+    if not skill_md.is_file():
+        print(f"[ERROR] Not a skill (no SKILL.md): {source}")
+        return None
+    path = Path(path).resolve()
+    skill_dir = path / skill_name
+    if skill_dir.exists():
+        print(f"[ERROR] Skill directory already exists: {skill_dir}")
+        return None
+    if path.is_relative_to(source):
+        print(f"[ERROR] Cannot create the copy inside the skill being copied: {skill_dir}")
+        return None
+    try:
+        content = skill_md.read_text(encoding="utf-8")
+        path.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=".init-skill-", dir=path))
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"[ERROR] Error reading {skill_md}: {e}")
+        return None
+
+    # Only drop editor/VCS/cache junk: files a .skillignore keeps out of archives still belong to the skill
+    rules = IgnoreRules(DEFAULT_IGNORE_PATTERNS)
+    methods = {"reflink": 0, "hardlink": 0, "copy": 0}
+    copied_bytes = 0
+    try:
+        target = staging / skill_name
+        target.mkdir()
+        for relpath, file_path in iter_skill_files(source, rules):
+            if relpath in ("SKILL.md", MANIFEST_NAME):
+                continue
+            destination = target / relpath
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            method = clone_file(file_path, destination, allow_hardlink)
+            methods[method] += 1
+            if method == "copy":
+                copied_bytes += destination.stat().st_size
+        (target / "SKILL.md").write_text(
+            rename_skill_md(content, skill_name, title_case_skill_name(skill_name)), encoding="utf-8"
+        )
+        shutil.copymode(skill_md, target / "SKILL.md")
+        os.rename(target, skill_dir)
+    except OSError as e:
+        print(f"[ERROR] Error copying skill, nothing was kept: {e}")
+        return None
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    print(f"[OK] Created skill directory: {skill_dir}")
+    print(
+        f"[OK] Copied {sum(methods.values())} file(s) from {source.name}: {methods['reflink']} reflinked, "
+        f"{methods['hardlink']} hardlinked, {methods['copy']} copied ({format_size(copied_bytes)} written)"
+    )
+    print(f"[OK] Renamed SKILL.md to '{skill_name}'")
+    if methods["hardlink"]:
+        print("[WARN] Hardlinked files are shared with the original skill; replace them rather than editing in place")
+    print("\nNext steps:")
+    print("1. Update the description and any remaining mentions of the original skill in SKILL.md")
+    print("2. Run the validator when ready to check the skill structure")
+    return skill_dir
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Create a new skill directory with a SKILL.md template.",
     )
-    parser.add_argument("skill_name", help="Skill name (normalized to hyphen-case)")
+    parser.add_argument("skill_name", nargs="?", help="Skill name (normalized to hyphen-case)")
     parser.add_argument("--path", required=True, help="Output directory for the skill")
     parser.add_argument(
         "--resources",
@@ -333,8 +629,48 @@ def main():
         action="store_true",
         help="Create example files inside the selected resource directories",
     )
+    parser.add_argument(
+        "--manifest",
+        help="JSON or YAML list of skills (name, resources, examples) to create in one batch",
+    )
+    parser.add_argument(
+        "--from",
+        dest="source",
+        metavar="SKILL",
+        help="Copy an existing skill directory instead of using the template",
+    )
+    parser.add_argument(
+        "--hardlink",
+        action="store_true",
+        help="With --from: hardlink files the filesystem cannot reflink instead of copying them",
+    )
     args = parser.parse_args()
 
+    if args.hardlink and not args.source:
+        parser.error("--hardlink requires --from")
+    if args.source and (args.manifest or args.resources or args.examples):
+        parser.error("--from cannot be combined with --manifest, --resources or --examples")
+    if args.manifest:
+        if args.skill_name or args.resources or args.examples:
+            parser.error("--manifest cannot be combined with a skill name, --resources or --examples")
+        batch = load_manifest(args.manifest)
+        if batch is None:
+            sys.exit(1)
+        print(f"Initializing {len(batch)} skill(s) in {args.path}")
+        skill_dirs = init_skills(batch, args.path)
+        if skill_dirs is None:
+            sys.exit(1)
+        # Fresh templates still hold TODO placeholders, so failures here are reminders, not errors
+        results = validate_skills(skill_dirs)
+        invalid = [result for result in results if not result["valid"]]
+        for result in invalid:
+            print(f"[WARN] {result['path']}: {result['message']}")
+        print(f"\n[OK] {len(skill_dirs)} skill(s) initialized, {len(results) - len(invalid)} already valid")
+        print("Next: complete the TODO items in each SKILL.md and run the validator again.")
+        sys.exit(0)
+    if not args.skill_name:
+        parser.error("a skill name is required unless --manifest is given")
+
     raw_skill_name = args.skill_name
     skill_name = normalize_skill_name(raw_skill_name)
     if not skill_name:
@@ -349,6 +685,13 @@ def main():
     if skill_name != raw_skill_name:
         print(f"Note: Normalized skill name from '{raw_skill_name}' to '{skill_name}'.")
 
+    if args.source:
+        print(f"Copying skill {args.source} to {skill_name}")
+        print(f"   Location: {args.path}")
+        print()
+        result = clone_skill(args.source, skill_name, args.path, args.hardlink)
+        sys.exit(0 if result else 1)
+
     resources = parse_resources(args.resources)
     if args.examples and not resources:
         print("[ERROR] --examples requires --resources to be set.")
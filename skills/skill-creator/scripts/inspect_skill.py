@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Skill Inspector - Reads .skill archives without extracting them
+
+The archive is memory-mapped and only its central directory is parsed up
+front; SKILL.md frontmatter and individual members are decompressed on
+demand, in chunks, straight from the mapping.
+
+Usage:
+    python utils/inspect_skill.py <file.skill>... [--json]
+    python utils/inspect_skill.py <file.skill> --list
+    python utils/inspect_skill.py <file.skill> --cat scripts/example.py
+
+Example:
+    python utils/inspect_skill.py dist/*.skill
+    python utils/inspect_skill.py dist/my-skill.skill --cat SKILL.md > SKILL.md
+"""
+
+import argparse
+import bz2
+import json
+import lzma
+import mmap
+import os
+import struct
+import sys
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from quick_validate import parse_frontmatter
+
+EOCD_SIGNATURE = b"PK\x05\x06"
+EOCD_FORMAT = "<4s4H2LH"
+ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+ZIP64_LOCATOR_FORMAT = "<4sLQL"
+ZIP64_EOCD_FORMAT = "<4sQ2H2L4Q"
+CENTRAL_SIGNATURE = b"PK\x01\x02"
+CENTRAL_FORMAT = "<4s4B4HL2L5H2L"
+LOCAL_SIGNATURE = b"PK\x03\x04"
+LOCAL_FORMAT = "<4s5H3L2H"
+# EOCD record plus the longest possible archive comment
+MAX_EOCD_SEARCH = struct.calcsize(EOCD_FORMAT) + 0xFFFF
+
+STORED, DEFLATED, BZIP2, LZMA = 0, 8, 12, 14
+CHUNK_SIZE = 64 * 1024
+
+
+class SkillArchiveError(ValueError):
+    """The file is not a readable .skill archive."""
+
+
+@dataclass(frozen=True)
+class Member:
+    name: str
+    method: int
+    flags: int
+    crc: int
+    compress_size: int
+    file_size: int
+    header_offset: int
+
+
+class SkillArchive:
+    """Random access to the members and metadata of a .skill archive."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise SkillArchiveError(f"{self.path} is empty")
+        try:
+            self.members = self._read_central_directory()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _read_central_directory(self):
+        data = self._map
+        eocd = data.rfind(EOCD_SIGNATURE, max(0, len(data) - MAX_EOCD_SEARCH))
+        if eocd < 0:
+            raise SkillArchiveError(f"{self.path} is not a zip archive")
+        _, _, _, _, count, cd_size, cd_offset, _ = struct.unpack_from(EOCD_FORMAT, data, eocd)
+
+        if count == 0xFFFF or cd_offset == 0xFFFFFFFF or cd_size == 0xFFFFFFFF:
+            locator = eocd - struct.calcsize(ZIP64_LOCATOR_FORMAT)
+            signature, _, zip64_eocd, _ = struct.unpack_from(ZIP64_LOCATOR_FORMAT, data, locator)
+            if signature != ZIP64_LOCATOR_SIGNATURE:
+                raise SkillArchiveError(f"{self.path} has a corrupt zip64 end record")
+            fields = struct.unpack_from(ZIP64_EOCD_FORMAT, data, zip64_eocd)
+            count, cd_size, cd_offset = fields[7], fields[8], fields[9]
+
+        members = {}
+        offset = cd_offset
+        entry_size = struct.calcsize(CENTRAL_FORMAT)
+        for _ in range(count):
+            fields = struct.unpack_from(CENTRAL_FORMAT, data, offset)
+            if fields[0] != CENTRAL_SIGNATURE:
+                raise SkillArchiveError(f"{self.path} has a corrupt central directory")
+            flags, method, crc, compress_size, file_size = fields[5], fields[6], fields[9], fields[10], fields[11]
+            name_len, extra_len, comment_len = fields[12], fields[13], fields[14]
+            header_offset = fields[18]
+
+            name_start = offset + entry_size
+            raw_name = data[name_start:name_start + name_len]
+            name = raw_name.decode("utf-8" if flags & 0x800 else "cp437")
+            extra = data[name_start + name_len:name_start + name_len + extra_len]
+            file_size, compress_size, header_offset = _apply_zip64_extra(
+                extra, file_size, compress_size, header_offset
+            )
+
+            members[name] = Member(name, method, flags, crc, compress_size, file_size, header_offset)
+            offset = name_start + name_len + extra_len + comment_len
+        return members
+
+    @property
+    def skill_name(self):
+        """The top-level folder every member lives in."""
+        for name in self.members:
+            return name.split("/", 1)[0]
+        raise SkillArchiveError(f"{self.path} is empty")
+
+    def resolve(self, name):
+        """Accept either a full member name or one relative to the skill folder."""
+        if name in self.members:
+            return self.members[name]
+        qualified = f"{self.skill_name}/{name}"
+        if qualified in self.members:
+            return self.members[qualified]
+        raise KeyError(name)
+
+    def _compressed_chunks(self, member):
+        fields = struct.unpack_from(LOCAL_FORMAT, self._map, member.header_offset)
+        if fields[0] != LOCAL_SIGNATURE:
+            raise SkillArchiveError(f"Corrupt local header for {member.name}")
+        start = member.header_offset + struct.calcsize(LOCAL_FORMAT) + fields[9] + fields[10]
+        view = memoryview(self._map)
+        try:
+            for offset in range(start, start + member.compress_size, CHUNK_SIZE):
+                yield view[offset:min(offset + CHUNK_SIZE, start + member.compress_size)]
+        finally:
+            view.release()
+
+    def open(self, name):
+        """Yield the decompressed content of a member in chunks, verifying its CRC at the end."""
+        member = self.resolve(name)
+        if member.flags & 0x1:
+            raise SkillArchiveError(f"{member.name} is encrypted")
+
+        crc = 0
+        for chunk in _decompress(member, self._compressed_chunks(member)):
+            crc = zlib.crc32(chunk, crc)
+            yield chunk
+        if crc != member.crc:
+            raise SkillArchiveError(f"CRC mismatch for {member.name}")
+
+    def read(self, name):
+        return b"".join(self.open(name))
+
+    def metadata(self):
+        """
+        Parse the SKILL.md frontmatter, decompressing only until the closing "---".
+
+        Returns the frontmatter dict; raises SkillArchiveError if it is missing or invalid.
+        """
+        head = b""
+        stream = self.open("SKILL.md")
+        try:
+            for chunk in stream:
+                head += chunk
+                # Stop at the closing delimiter, or as soon as there is no frontmatter
+                if not head.startswith(b"---") or b"\n---" in head[3:]:
+                    break
+        finally:
+            stream.close()
+        frontmatter, error = parse_frontmatter(head.decode("utf-8", errors="replace"))
+        if error:
+            raise SkillArchiveError(f"{self.path}: {error}")
+        return frontmatter
+
+    def manifest(self):
+        """The packaging manifest (per-file hashes), or None for archives built without one."""
+        try:
+            return json.loads(self.read(".skill-manifest.json"))
+        except KeyError:
+            return None
+
+
+def _apply_zip64_extra(extra, file_size, compress_size, header_offset):
+    """Replace 0xFFFFFFFF placeholders with values from the zip64 extra field."""
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, size = struct.unpack_from("<HH", extra, offset)
+        if header_id == 0x0001:
+            values = list(struct.unpack_from(f"<{size // 8}Q", extra, offset + 4))
+            if file_size == 0xFFFFFFFF and values:
+                file_size = values.pop(0)
+            if compress_size == 0xFFFFFFFF and values:
+                compress_size = values.pop(0)
+            if header_offset == 0xFFFFFFFF and values:
+                header_offset = values.pop(0)
+            break
+        offset += 4 + size
+    return file_size, compress_size, header_offset
+
+
+def _decompress(member, chunks):
+    """Streaming decompression of a member's data, bounded to CHUNK_SIZE of output per step."""
+    if member.method == STORED:
+        for chunk in chunks:
+            yield bytes(chunk)
+        return
+
+    if member.method == DEFLATED:
+        decompressor = zlib.decompressobj(-15)
+        for chunk in chunks:
+            data = chunk
+            while data:
+                out = decompressor.decompress(data, CHUNK_SIZE)
+                data = decompressor.unconsumed_tail
+                if out:
+                    yield out
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+        return
+
+    if member.method == BZIP2:
+        decompressor = bz2.BZ2Decompressor()
+    elif member.method == LZMA:
+        chunks = iter(chunks)
+        decompressor, first = _lzma_decompressor(chunks)
+        chunks = (chunk for part in ([first], chunks) for chunk in part)
+    else:
+        raise SkillArchiveError(f"{member.name} uses unsupported compression method {member.method}")
+
+    for chunk in chunks:
+        out = decompressor.decompress(bytes(chunk), CHUNK_SIZE)
+        if out:
+            yield out
+        while not decompressor.needs_input and not decompressor.eof:
+            out = decompressor.decompress(b"", CHUNK_SIZE)
+            if out:
+                yield out
+
+
+def _lzma_decompressor(chunks):
+    """Build a raw LZMA1 decompressor from the zip LZMA header; returns it and the leftover data."""
+    head = b""
+    for chunk in chunks:
+        head += bytes(chunk)
+        if len(head) >= 4 and len(head) >= 4 + struct.unpack_from("<H", head, 2)[0]:
+            break
+    props_size = struct.unpack_from("<H", head, 2)[0]
+    props = head[4:4 + props_size]
+    lclppb, dict_size = struct.unpack_from("<BI", props)
+    filters = [{
+        "id": lzma.FILTER_LZMA1,
+        "lc": lclppb % 9,
+        "lp": (lclppb // 9) % 5,
+        "pb": lclppb // 45,
+        "dict_size": dict_size,
+    }]
+    return lzma.LZMADecompressor(lzma.FORMAT_RAW, filters=filters), head[4 + props_size:]
+
+
+def describe(path):
+    """Summary of one archive for listings: name, description, member count and sizes."""
+    with SkillArchive(path) as archive:
+        frontmatter = archive.metadata()
+        return {
+            "archive": str(path),
+            "skill": archive.skill_name,
+            "name": frontmatter.get("name"),
+            "description": frontmatter.get("description"),
+            "metadata": frontmatter.get("metadata"),
+            "members": len(archive.members),
+            "size": os.path.getsize(path),
+            "uncompressed_size": sum(member.file_size for member in archive.members.values()),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Inspect .skill archives without extracting them.",
+    )
+    parser.add_argument("archives", nargs="+", help=".skill file(s) to inspect")
+    parser.add_argument("--list", action="store_true", help="List members with their sizes")
+    parser.add_argument("--cat", metavar="MEMBER", help="Write one member to stdout (path relative to the skill folder)")
+    parser.add_argument("--json", action="store_true", help="Print summaries as JSON")
+    args = parser.parse_args()
+
+    if (args.list or args.cat) and len(args.archives) != 1:
+        parser.error("--list and --cat take exactly one archive")
+
+    try:
+        if args.cat:
+            with SkillArchive(args.archives[0]) as archive:
+                for chunk in archive.open(args.cat):
+                    sys.stdout.buffer.write(chunk)
+            return
+        if args.list:
+            with SkillArchive(args.archives[0]) as archive:
+                for member in archive.members.values():
+                    print(f"{member.file_size:>10}  {member.compress_size:>10}  {member.name}")
+            return
+
+        summaries = [describe(path) for path in args.archives]
+    except KeyError as e:
+        print(f"[ERROR] Member not found: {e}")
+        sys.exit(1)
+    except (OSError, SkillArchiveError) as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(summaries, indent=2))
+        return
+    for summary in summaries:
+        print(f"{summary['name']} ({summary['members']} files, {summary['size']} bytes): {summary['description']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,30 +3,604 @@
 Skill Packager - Creates a distributable .skill file of a skill folder
 
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory|-] [--method deflate|bzip2|lzma] [--level N]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py skills/public/my-skill ./dist --method lzma --level 9
+    python utils/package_skill.py --all skills ./dist
+    python utils/package_skill.py skills/public/my-skill - | ssh node 'cat > my-skill.skill'
+
+With "-" as the output directory the archive is written to stdout as it is
+built (sizes are known before each member header, so nothing seeks back) and
+the log goes to stderr.
+
+Already-compressed files (images, fonts, archives, media) are stored as-is;
+everything else is compressed with the selected method.
+
+Archives are reproducible (sorted entries, fixed timestamps and permissions)
+and embed a manifest of per-file SHA-256 hashes; when the source tree still
+matches the manifest of an existing archive, packaging is skipped (--force
+rebuilds anyway). Set SOURCE_DATE_EPOCH to choose the member timestamp.
+
+Files matching .skillignore in the skill folder (gitignore syntax) or the
+built-in defaults (VCS metadata, caches, virtualenvs, node_modules, editor
+temp files) are left out; ignored directories are never descended into.
+
+--all <root> packages every directory under root that contains SKILL.md on a
+process pool and writes index.json (archive sizes and SHA-256) to the output
+directory.
+
+--delta-from <old.skill> also writes <name>.skill-delta next to the new archive:
+only the members that changed since old.skill plus a list of deleted files.
+On the receiving side, --apply-delta rebuilds the full archive from the old
+one, copying unchanged members without recompressing them, and checks that
+the result is byte-identical to the archive the delta was made from:
+
+    python utils/package_skill.py skills/public/my-skill ./dist --delta-from ./release/my-skill.skill
+    python utils/package_skill.py --apply-delta my-skill.skill-delta ./installed/my-skill.skill
 """
 
+import argparse
+import bz2
+import contextlib
+import copy
+import io
+import hashlib
+import json
+import lzma
+import math
+import os
+import re
+import stat
+import struct
 import sys
+import time
 import zipfile
+import zlib
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
 
-from quick_validate import validate_skill
+from quick_validate import discover_skills, validate_skill
+from skill_profile import phase, profiled
+
+
+COMPRESSION_METHODS = {
+    "deflate": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+DEFAULT_LEVELS = {"deflate": 6, "bzip2": 9, "lzma": 6}
+
+# Leading bytes of formats that are already compressed
+COMPRESSED_MAGIC = (
+    b"\x89PNG\r\n\x1a\n",  # PNG
+    b"\xff\xd8\xff",  # JPEG
+    b"GIF8",  # GIF
+    b"wOF2",  # WOFF2
+    b"wOFF",  # WOFF
+    b"PK\x03\x04",  # zip, jar, docx/xlsx/pptx, .skill
+    b"\x1f\x8b",  # gzip
+    b"BZh",  # bzip2
+    b"\xfd7zXZ\x00",  # xz
+    b"\x28\xb5\x2f\xfd",  # zstd
+    b"7z\xbc\xaf\x27\x1c",  # 7z
+    b"OggS",  # ogg
+    b"fLaC",  # flac
+    b"ID3",  # mp3
+    b"\x1a\x45\xdf\xa3",  # webm/mkv
+)
+# RIFF containers whose payload is compressed (WebP images, AVI video)
+COMPRESSED_RIFF_TYPES = (b"WEBP", b"AVI ")
+# ISO base media (mp4, mov, heic, avif) carry "ftyp" at offset 4
+ISO_BMFF_MARKER = b"ftyp"
+
+ENTROPY_SAMPLE_BYTES = 64 * 1024
+# Bits per byte above which a sample is treated as incompressible
+STORE_ENTROPY_THRESHOLD = 7.5
+
+INDEX_NAME = "index.json"
+
+IGNORE_FILE = ".skillignore"
+# Applied before .skillignore, so "!pattern" there can re-include any of these
+DEFAULT_IGNORE_PATTERNS = [
+    ".git/",
+    ".hg/",
+    ".svn/",
+    "__pycache__/",
+    "*.py[co]",
+    "node_modules/",
+    ".venv/",
+    "venv/",
+    ".mypy_cache/",
+    ".pytest_cache/",
+    ".ruff_cache/",
+    ".idea/",
+    ".vscode/",
+    ".DS_Store",
+    "Thumbs.db",
+    "*.swp",
+    "*.swo",
+    "*~",
+    ".#*",
+]
+
+MANIFEST_NAME = ".skill-manifest.json"
+MANIFEST_VERSION = 1
+DELTA_NAME = ".skill-delta.json"
+DELTA_VERSION = 1
+DELTA_SUFFIX = ".skill-delta"
+# Earliest timestamp a zip header can represent
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+# LZMA dictionary sizes per preset, needed to build the zip LZMA properties header
+LZMA_DICT_SIZES = [1 << 18, 1 << 20, 1 << 21, 1 << 22, 1 << 22, 1 << 23, 1 << 23, 1 << 24, 1 << 25, 1 << 26]
+
+
+def sample_entropy(sample):
+    """Shannon entropy of a byte string in bits per byte (0.0 to 8.0)."""
+    if not sample:
+        return 0.0
+    total = len(sample)
+    return -sum((count / total) * math.log2(count / total) for count in Counter(sample).values())
+
+
+def is_incompressible(data):
+    """Sniff magic bytes, then entropy-sample the first block."""
+    if data.startswith(COMPRESSED_MAGIC):
+        return True
+    if data[:4] == b"RIFF" and data[8:12] in COMPRESSED_RIFF_TYPES:
+        return True
+    if data[4:8] == ISO_BMFF_MARKER:
+        return True
+    return sample_entropy(data[:ENTROPY_SAMPLE_BYTES]) > STORE_ENTROPY_THRESHOLD
+
+
+def compress_bytes(data, method, level):
+    """Compress data into the stream format the zip spec expects for method."""
+    if method == "deflate":
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        return compressor.compress(data) + compressor.flush()
+    if method == "bzip2":
+        return bz2.compress(data, level)
+    if method == "lzma":
+        # Raw LZMA1 stream preceded by the zip LZMA header: version, props size, props
+        dict_size = LZMA_DICT_SIZES[level]
+        lc, lp, pb = 3, 0, 2
+        compressor = lzma.LZMACompressor(
+            lzma.FORMAT_RAW,
+            filters=[{"id": lzma.FILTER_LZMA1, "preset": level, "dict_size": dict_size, "lc": lc, "lp": lp, "pb": pb}],
+        )
+        props = struct.pack("<BI", (pb * 5 + lp) * 9 + lc, dict_size)
+        return struct.pack("<BBH", 9, 4, len(props)) + props + compressor.compress(data) + compressor.flush()
+    raise ValueError(f"Unknown compression method: {method}")
+
+
+def archive_timestamp():
+    """Timestamp for every member: SOURCE_DATE_EPOCH if set, else the zip epoch."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH", "")
+    if epoch.isdigit():
+        return max(time.gmtime(int(epoch))[:6], ZIP_EPOCH)
+    return ZIP_EPOCH
+
+
+def make_zipinfo(arcname, executable=False):
+    """ZipInfo with normalized timestamp, permissions and host system."""
+    zinfo = zipfile.ZipInfo(arcname, date_time=archive_timestamp())
+    # Unix host, so external_attr carries the permission bits on every platform
+    zinfo.create_system = 3
+    zinfo.external_attr = (stat.S_IFREG | (0o755 if executable else 0o644)) << 16
+    return zinfo
+
+
+def compress_member(file_path, arcname, method="deflate", level=None):
+    """
+    Read and compress one file independently of the rest of the archive.
+
+    zlib, bz2 and lzma release the GIL while compressing, so members can be
+    compressed on a thread pool. Returns a normalized ZipInfo with CRC and
+    sizes filled in, the member payload and the seconds spent, ready for
+    write_compressed_member().
+    """
+    started = time.perf_counter()
+    executable = bool(Path(file_path).stat().st_mode & 0o111)
+    zinfo = make_zipinfo(arcname, executable)
+    data = Path(file_path).read_bytes()
+    payload = compress_data(zinfo, data, method, level)
+    return zinfo, payload, time.perf_counter() - started
+
+
+def compress_data(zinfo, data, method="deflate", level=None):
+    """
+    Compress data for zinfo, filling in its compression type, CRC and sizes.
+
+    Incompressible content is stored (ZIP_STORED), as is anything the selected
+    method fails to shrink. Returns the member payload.
+    """
+    level = DEFAULT_LEVELS[method] if level is None else level
+    payload = None
+    if not is_incompressible(data):
+        payload = compress_bytes(data, method, level)
+        if len(payload) >= len(data):
+            payload = None
+    if payload is None:
+        zinfo.compress_type = zipfile.ZIP_STORED
+        payload = data
+    else:
+        zinfo.compress_type = COMPRESSION_METHODS[method]
+        if method == "lzma":
+            # Bit 1: the stream is terminated by an end-of-stream marker
+            zinfo.flag_bits |= 0x02
+
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(payload)
+    zinfo.CRC = zlib.crc32(data)
+    return payload
+
+
+def hash_file(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(skill_name, files, method, level, pool):
+    """
+    Describe the source tree: per-file SHA-256, size and mode plus the packaging options.
+
+    Two trees with equal manifests produce byte-identical archives.
+    """
+    hashes = pool.map(hash_file, [file_path for _, file_path in files])
+    entries = {}
+    for (arcname, file_path), sha256 in zip(files, hashes):
+        st = file_path.stat()
+        entries[arcname] = {
+            "sha256": sha256,
+            "size": st.st_size,
+            "mode": "0755" if st.st_mode & 0o111 else "0644",
+        }
+    return {
+        "version": MANIFEST_VERSION,
+        "skill": skill_name,
+        "compression": {"method": method, "level": level},
+        "timestamp": list(archive_timestamp()),
+        "files": entries,
+    }
+
+
+def read_archive_manifest(archive_path, manifest_arcname):
+    """Return the manifest embedded in an existing archive, or None."""
+    try:
+        with zipfile.ZipFile(archive_path) as zipf:
+            return json.loads(zipf.read(manifest_arcname))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+
+def translate_ignore_pattern(pattern):
+    """Translate the glob part of a gitignore pattern into a regex over "/"-separated paths."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2:]:
+            end = pattern.index("]", i + 2)
+            chars = pattern[i + 1:end]
+            if chars.startswith("!"):
+                chars = "^" + chars[1:]
+            out.append("[" + chars.replace("\\", "\\\\") + "]")
+            i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+class IgnoreRules:
+    """Ordered gitignore-style rules matched against paths relative to the skill folder."""
+
+    def __init__(self, lines):
+        self.rules = []
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            elif line.startswith("\\"):
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            # A slash anywhere but the end anchors the pattern to the skill folder
+            anchored = "/" in line
+            body = translate_ignore_pattern(line.lstrip("/"))
+            regex = re.compile(body if anchored else f"(?:.*/)?{body}")
+            self.rules.append((regex, negate, dir_only))
+
+    @classmethod
+    def for_skill(cls, skill_path):
+        lines = list(DEFAULT_IGNORE_PATTERNS)
+        ignore_file = Path(skill_path) / IGNORE_FILE
+        if ignore_file.is_file():
+            lines.extend(ignore_file.read_text(encoding="utf-8").splitlines())
+        return cls(lines)
+
+    def ignored(self, relpath, is_dir):
+        """The last matching rule wins, as in gitignore."""
+        result = False
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(relpath):
+                result = not negate
+        return result
+
+
+def iter_skill_files(skill_path, rules):
+    """
+    Yield (relpath, path) for every file in the skill folder not excluded by rules.
+
+    Uses os.scandir so file/directory checks come from the directory entry
+    rather than extra stat calls, and prunes ignored directories before
+    descending. Symlinked directories are not followed.
+    """
+    skill_path = Path(skill_path)
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(skill_path / rel_dir) as entries:
+            for entry in entries:
+                relpath = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not rules.ignored(relpath, True):
+                        stack.append(relpath)
+                elif entry.is_file() and not rules.ignored(relpath, False):
+                    yield relpath, Path(entry.path)
+
+
+def format_size(num_bytes):
+    for unit in ("B", "KB", "MB"):
+        if num_bytes < 1024 or unit == "MB":
+            return f"{num_bytes:.0f} {unit}" if unit == "B" else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+
+
+# write_compressed_member and read_raw_member reach into ZipFile internals (fp,
+# filelist, NameToInfo, start_dir, and _didModify being set by mode "w") and the
+# private _FH_* header offsets. These are unchanged from CPython 3.8 through 3.13;
+# re-check them on a new release. Archives written with them go through
+# verify_archive() so a mismatch fails loudly instead of shipping a corrupt file.
+def write_compressed_member(zipf, zinfo, payload):
+    """Append an already-compressed member to an open ZipFile (mode "w")."""
+    zinfo.header_offset = zipf.fp.tell()
+    zipf.fp.write(zinfo.FileHeader())
+    zipf.fp.write(payload)
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+    zipf.start_dir = zipf.fp.tell()
+
+
+def read_raw_member(zipf, zinfo):
+    """Return a member's compressed payload exactly as stored in the archive."""
+    zipf.fp.seek(zinfo.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, zipf.fp.read(zipfile.sizeFileHeader))
+    zipf.fp.seek(header[zipfile._FH_FILENAME_LENGTH] + header[zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+    return zipf.fp.read(zinfo.compress_size)
 
 
-def package_skill(skill_path, output_dir=None):
+def verify_archive(archive_path):
+    """Reopen a written archive and check every member's CRC; raises zipfile.BadZipFile if any is corrupt."""
+    with zipfile.ZipFile(archive_path) as zipf:
+        try:
+            bad_member = zipf.testzip()
+        except (EOFError, OSError, zlib.error, lzma.LZMAError) as e:
+            # A damaged stream can fail to decompress before its CRC is checked
+            raise zipfile.BadZipFile(f"{archive_path} is corrupt: {e}") from e
+    if bad_member is not None:
+        raise zipfile.BadZipFile(f"{archive_path} is corrupt: bad CRC for {bad_member}")
+
+
+def member_signature(zinfo):
+    """Everything besides the payload that ends up in a member's headers."""
+    return (
+        zinfo.date_time,
+        zinfo.compress_type,
+        zinfo.flag_bits,
+        zinfo.external_attr,
+        zinfo.CRC,
+        zinfo.file_size,
+        zinfo.compress_size,
+    )
+
+
+def make_delta(base_archive, target_archive, delta_path):
+    """
+    Write a delta archive that turns base_archive into target_archive.
+
+    The delta holds the target's manifest, the raw (already compressed)
+    members that are new or differ from the base, and a description listing
+    deleted files plus the SHA-256 of both archives. Members are compared by
+    manifest hash and header fields, so a change of compression settings or
+    timestamp ships the affected members too.
+
+    Returns:
+        Path to the delta file, or None if error
+    """
+    base_archive, target_archive, delta_path = Path(base_archive), Path(target_archive), Path(delta_path)
+    with zipfile.ZipFile(target_archive) as zipf:
+        manifest_arcname = next((name for name in zipf.namelist() if name.endswith(f"/{MANIFEST_NAME}")), None)
+    target_manifest = manifest_arcname and read_archive_manifest(target_archive, manifest_arcname)
+    if not target_manifest:
+        print(f"[ERROR] No packaging manifest in {target_archive}")
+        return None
+    skill_name = target_manifest["skill"]
+    base_manifest = read_archive_manifest(base_archive, manifest_arcname)
+    if base_manifest is None:
+        print(f"[ERROR] {base_archive} is not a packaged '{skill_name}' skill with a manifest; ship the full archive instead")
+        return None
+
+    tmp_path = delta_path.with_name(f".{delta_path.name}.tmp")
+    try:
+        with zipfile.ZipFile(base_archive) as base, zipfile.ZipFile(target_archive) as target:
+            changed = []
+            for arcname, entry in target_manifest["files"].items():
+                base_info = base.NameToInfo.get(arcname)
+                if (
+                    base_manifest["files"].get(arcname) != entry
+                    or base_info is None
+                    or member_signature(base_info) != member_signature(target.getinfo(arcname))
+                ):
+                    changed.append(arcname)
+            deleted = sorted(set(base_manifest["files"]) - set(target_manifest["files"]))
+
+            delta = {
+                "version": DELTA_VERSION,
+                "skill": skill_name,
+                "base": {"sha256": hash_file(base_archive), "size": base_archive.stat().st_size},
+                "target": {"sha256": hash_file(target_archive), "size": target_archive.stat().st_size},
+                "changed": sorted(changed),
+                "deleted": deleted,
+            }
+            with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+                delta_data = json.dumps(delta, indent=2, sort_keys=True).encode("utf-8")
+                zinfo = make_zipinfo(f"{skill_name}/{DELTA_NAME}")
+                write_compressed_member(zipf, zinfo, compress_data(zinfo, delta_data))
+                for arcname in [manifest_arcname, *delta["changed"]]:
+                    zinfo = target.getinfo(arcname)
+                    write_compressed_member(zipf, copy.copy(zinfo), read_raw_member(target, zinfo))
+
+        verify_archive(tmp_path)
+        os.replace(tmp_path, delta_path)
+        print(
+            f"[OK] Delta against {base_archive.name}: {len(changed)} changed, {len(deleted)} deleted, "
+            f"{len(target_manifest['files']) - len(changed)} unchanged "
+            f"({format_size(delta_path.stat().st_size)} vs {format_size(delta['target']['size'])} full): {delta_path}"
+        )
+        return delta_path
+
+    except Exception as e:
+        print(f"[ERROR] Error creating delta: {e}")
+        return None
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def apply_delta(delta_path, base_archive, output_dir=None):
+    """
+    Rebuild the full .skill archive from a base archive and a delta.
+
+    Unchanged members are copied from the base without recompression. The
+    base must be the exact archive the delta was made against, and the
+    result must hash to the recorded target archive, otherwise nothing is
+    written.
+
+    Args:
+        delta_path: Path to the .skill-delta file
+        base_archive: Path to the .skill file the delta was made against
+        output_dir: Directory for the rebuilt .skill (defaults to the base archive's directory)
+
+    Returns:
+        Path to the rebuilt .skill file, or None if error
+    """
+    delta_path, base_archive = Path(delta_path), Path(base_archive)
+    try:
+        with zipfile.ZipFile(delta_path) as zipf:
+            delta_arcname = next(name for name in zipf.namelist() if name.endswith(f"/{DELTA_NAME}"))
+            delta = json.loads(zipf.read(delta_arcname))
+    except (OSError, StopIteration, ValueError, zipfile.BadZipFile):
+        print(f"[ERROR] Not a skill delta: {delta_path}")
+        return None
+    if delta.get("version") != DELTA_VERSION:
+        print(f"[ERROR] Unsupported delta version {delta.get('version')} in {delta_path}")
+        return None
+
+    try:
+        if hash_file(base_archive) != delta["base"]["sha256"]:
+            print(f"[ERROR] {base_archive} is not the archive this delta was made against")
+            return None
+    except OSError as e:
+        print(f"[ERROR] {e}")
+        return None
+
+    skill_name = delta["skill"]
+    output_path = Path(output_dir).resolve() if output_dir else base_archive.resolve().parent
+    output_path.mkdir(parents=True, exist_ok=True)
+    skill_filename = output_path / f"{skill_name}.skill"
+    manifest_arcname = f"{skill_name}/{MANIFEST_NAME}"
+
+    tmp_filename = skill_filename.with_name(f".{skill_filename.name}.tmp")
+    try:
+        with zipfile.ZipFile(delta_path) as patch, zipfile.ZipFile(base_archive) as base:
+            manifest = json.loads(patch.read(manifest_arcname))
+            # Same member order as package_skill: manifest first, then sorted files
+            with zipfile.ZipFile(tmp_filename, "w", zipfile.ZIP_DEFLATED) as zipf:
+                for arcname in [manifest_arcname, *sorted(manifest["files"])]:
+                    source = patch if arcname in patch.NameToInfo else base
+                    zinfo = source.getinfo(arcname)
+                    write_compressed_member(zipf, copy.copy(zinfo), read_raw_member(source, zinfo))
+
+        if hash_file(tmp_filename) != delta["target"]["sha256"]:
+            print("[ERROR] Rebuilt archive does not match the delta's target hash")
+            return None
+        os.replace(tmp_filename, skill_filename)
+        print(
+            f"[OK] Applied delta ({len(delta['changed'])} changed, {len(delta['deleted'])} deleted): {skill_filename}"
+        )
+        return skill_filename
+
+    except Exception as e:
+        print(f"[ERROR] Error applying delta: {e}")
+        return None
+    finally:
+        tmp_filename.unlink(missing_ok=True)
+
+
+def package_skill(
+    skill_path,
+    output_dir=None,
+    workers=None,
+    method="deflate",
+    level=None,
+    force=False,
+    delta_from=None,
+    stream=None,
+    status=None,
+):
     """
     Package a skill folder into a .skill file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
+        workers: Number of compression threads (defaults to the CPU count)
+        method: Compression for compressible files: deflate, bzip2 or lzma
+        level: Compression level for method (defaults to DEFAULT_LEVELS[method])
+        force: Rebuild even if the existing archive's manifest matches the source tree
+        delta_from: Optional previous .skill to write a <name>.skill-delta against
+        stream: Optional writable binary file object (e.g. a pipe) to write the
+            archive to instead of a file; it does not need to be seekable
+        status: Optional dict; "up_to_date" is set to whether the existing
+            archive already matched and was kept without rebuilding
 
     Returns:
-        Path to the created .skill file, or None if error
+        Path to the created .skill file (stream when streaming), or None if error
     """
     skill_path = Path(skill_path).resolve()
 
@@ -47,7 +621,8 @@ def package_skill(skill_path, output_dir=None):
 
     # Run validation before packaging
     print("Validating skill...")
-    valid, message = validate_skill(skill_path)
+    with phase("validate"):
+        valid, message = validate_skill(skill_path)
     if not valid:
         print(f"[ERROR] Validation failed: {message}")
         print("   Please fix the validation errors before packaging.")
@@ -63,43 +638,281 @@ def package_skill(skill_path, output_dir=None):
         output_path = Path.cwd()
 
     skill_filename = output_path / f"{skill_name}.skill"
+    delta_filename = output_path / f"{skill_name}{DELTA_SUFFIX}"
 
-    # Create the .skill file (zip format)
+    # Collect files in a stable order; arcnames are relative to the skill's parent
+    with phase("scan"):
+        rules = IgnoreRules.for_skill(skill_path)
+        files = sorted(
+            (f"{skill_name}/{relpath}", file_path)
+            for relpath, file_path in iter_skill_files(skill_path, rules)
+            if relpath != MANIFEST_NAME
+        )
+    manifest_arcname = f"{skill_name}/{MANIFEST_NAME}"
+    level = DEFAULT_LEVELS[method] if level is None else level
+    workers = workers or os.cpu_count() or 1
+
+    # Create the .skill file (zip format) next to the target, then move it into place
+    tmp_filename = skill_filename.with_name(f".{skill_filename.name}.tmp")
     try:
-        with zipfile.ZipFile(skill_filename, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob("*"):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            with phase("manifest"):
+                manifest = build_manifest(skill_name, files, method, level, pool)
+            up_to_date = stream is None and not force and read_archive_manifest(skill_filename, manifest_arcname) == manifest
+            if status is not None:
+                status["up_to_date"] = up_to_date
+            if up_to_date:
+                print(f"[OK] Up to date (content hashes match): {skill_filename}")
+                if delta_from and not make_delta(delta_from, skill_filename, delta_filename):
+                    return None
+                return skill_filename
+
+            archive = tmp_filename if stream is None else stream
+            with phase("compress"), zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zipf:
+                # The manifest sorts ahead of every other member of the skill folder
+                manifest_data = json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+                zinfo = make_zipinfo(manifest_arcname)
+                write_compressed_member(zipf, zinfo, compress_data(zinfo, manifest_data, method, level))
+
+                # Compress members in parallel, but write them in sorted order and keep
+                # only a bounded window of compressed members in memory
+                remaining = iter(files)
+                pending = deque(
+                    pool.submit(compress_member, file_path, arcname, method, level)
+                    for arcname, file_path in islice(remaining, workers * 2)
+                )
+                total_in = total_out = total_seconds = 0
+                while pending:
+                    zinfo, payload, seconds = pending.popleft().result()
+                    write_compressed_member(zipf, zinfo, payload)
+                    total_in += zinfo.file_size
+                    total_out += zinfo.compress_size
+                    total_seconds += seconds
+                    stored = zinfo.compress_type == zipfile.ZIP_STORED
+                    saved = zinfo.file_size - zinfo.compress_size
+                    print(
+                        f"  Added: {zinfo.filename} ({'stored' if stored else method}, "
+                        f"{format_size(zinfo.file_size)} -> {format_size(zinfo.compress_size)}, "
+                        f"saved {format_size(saved)} in {seconds * 1000:.1f} ms)"
+                    )
+                    for arcname, file_path in islice(remaining, 1):
+                        pending.append(pool.submit(compress_member, file_path, arcname, method, level))
+
+                print(
+                    f"\n  Total: {format_size(total_in)} -> {format_size(total_out)}, "
+                    f"saved {format_size(total_in - total_out)} in {total_seconds * 1000:.1f} ms of compression"
+                )
+
+        if stream is not None:
+            stream.flush()
+            print("\n[OK] Successfully streamed skill package")
+            return stream
+
+        verify_archive(tmp_filename)
 
+        # Diff before replacing, so delta_from may be the archive being rebuilt
+        if delta_from:
+            print()
+            with phase("delta"):
+                if not make_delta(delta_from, tmp_filename, delta_filename):
+                    return None
+        os.replace(tmp_filename, skill_filename)
         print(f"\n[OK] Successfully packaged skill to: {skill_filename}")
         return skill_filename
 
     except Exception as e:
         print(f"[ERROR] Error creating .skill file: {e}")
         return None
+    finally:
+        if stream is None:
+            tmp_filename.unlink(missing_ok=True)
+
+
+def package_skill_quietly(skill_path, output_dir, method, level, force):
+    """Process-pool entry point: package one skill and capture its log instead of printing it."""
+    started = time.perf_counter()
+    log = io.StringIO()
+    status = {}
+    try:
+        with contextlib.redirect_stdout(log):
+            # The pool already spans the cores; one compression thread per skill
+            result = package_skill(
+                skill_path, output_dir, workers=1, method=method, level=level, force=force, status=status
+            )
+    except Exception as e:
+        print(f"[ERROR] {e}", file=log)
+        result = None
+    entry = {
+        "skill": Path(skill_path).name,
+        "source": str(skill_path),
+        "ok": result is not None,
+        "seconds": round(time.perf_counter() - started, 3),
+        "log": log.getvalue(),
+    }
+    if result is not None:
+        entry.update(
+            archive=result.name,
+            size=result.stat().st_size,
+            sha256=hash_file(result),
+            up_to_date=status.get("up_to_date", False),
+        )
+    return entry
+
+
+def package_all(root, output_dir=None, method="deflate", level=None, force=False, jobs=None):
+    """
+    Validate and package every skill under root concurrently.
+
+    Per-skill results are printed as they complete and an index of the produced
+    archives is written to output_dir. Returns the list of failed skill names.
+    """
+    output_path = Path(output_dir).resolve() if output_dir else Path.cwd()
+    output_path.mkdir(parents=True, exist_ok=True)
+    skills = discover_skills(root)
+    if not skills:
+        print(f"[ERROR] No skills (directories with SKILL.md) found under {root}")
+        return [str(root)]
+
+    results = []
+    failed = []
+    by_name = {}
+    for skill in skills:
+        by_name.setdefault(skill.name, []).append(skill)
+    for name, paths in by_name.items():
+        if len(paths) > 1:
+            # Both would be written to <name>.skill
+            print(f"[ERROR] {name}: duplicate skill folder name ({', '.join(str(path) for path in paths)})")
+            failed.append(name)
+    skills = [skill for skill in skills if skill.name not in failed]
+
+    print(f"Packaging {len(skills)} skill(s) from {root} into {output_path}\n")
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        futures = [
+            pool.submit(package_skill_quietly, skill, output_path, method, level, force)
+            for skill in skills
+        ]
+        for future in as_completed(futures):
+            entry = future.result()
+            if entry["ok"]:
+                results.append(entry)
+                status = "up to date" if entry["up_to_date"] else f"{entry['seconds']:.2f}s"
+                print(f"[OK] {entry['skill']}: {entry['archive']} ({format_size(entry['size'])}, {status})")
+            else:
+                failed.append(entry["skill"])
+                errors = [line.removeprefix("[ERROR]").strip() for line in entry["log"].splitlines() if line.startswith("[ERROR]")]
+                print(f"[ERROR] {entry['skill']}: {' '.join(errors) or 'packaging failed'}")
+
+    index = {
+        "skills": [
+            {key: entry[key] for key in ("skill", "archive", "size", "sha256")}
+            for entry in sorted(results, key=lambda entry: entry["skill"])
+        ],
+        "failed": sorted(failed),
+    }
+    (output_path / INDEX_NAME).write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
+    print(f"\n[OK] Packaged {len(results)} skill(s), {len(failed)} failed. Index: {output_path / INDEX_NAME}")
+    return failed
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
-        print("\nExample:")
-        print("  python utils/package_skill.py skills/public/my-skill")
-        print("  python utils/package_skill.py skills/public/my-skill ./dist")
+    parser = argparse.ArgumentParser(
+        description="Package a skill folder into a distributable .skill file.",
+    )
+    parser.add_argument("skill_path", nargs="?", help="Path to the skill folder")
+    parser.add_argument(
+        "output_dir",
+        nargs="?",
+        help="Output directory (defaults to current directory), or - to write the archive to stdout",
+    )
+    parser.add_argument(
+        "--all",
+        metavar="ROOT",
+        help="Package every skill under ROOT concurrently (the positional argument is then the output directory)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Processes used by --all (defaults to the CPU count)",
+    )
+    parser.add_argument(
+        "--method",
+        choices=sorted(COMPRESSION_METHODS),
+        default="deflate",
+        help="Compression for compressible files (default: deflate); incompressible files are stored",
+    )
+    parser.add_argument(
+        "--level",
+        type=int,
+        help="Compression level for --method (deflate 0-9, bzip2 1-9, lzma 0-9)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild even if the existing archive matches the source tree",
+    )
+    parser.add_argument(
+        "--delta-from",
+        metavar="OLD_SKILL",
+        help="Also write <name>.skill-delta with only the changes since this earlier .skill",
+    )
+    parser.add_argument(
+        "--apply-delta",
+        metavar="DELTA",
+        help="Rebuild a full .skill from DELTA and the base archive given as the positional argument",
+    )
+    args = parser.parse_args()
+
+    if args.apply_delta:
+        if not args.skill_path:
+            parser.error("--apply-delta needs the base .skill archive as the positional argument")
+        result = apply_delta(args.apply_delta, args.skill_path, args.output_dir)
+        sys.exit(0 if result else 1)
+
+    min_level = 1 if args.method == "bzip2" else 0
+    if args.level is not None and not min_level <= args.level <= 9:
+        print(f"[ERROR] --level for {args.method} must be between {min_level} and 9.")
         sys.exit(1)
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    if args.all:
+        if args.output_dir:
+            parser.error("--all takes at most one positional argument (the output directory)")
+        if args.delta_from:
+            parser.error("--delta-from packages a single skill")
+        if args.skill_path == "-":
+            parser.error("--all writes one archive per skill and cannot stream to stdout")
+        failed = package_all(args.all, args.skill_path, method=args.method, level=args.level, force=args.force, jobs=args.jobs)
+        sys.exit(1 if failed else 0)
+    if not args.skill_path:
+        parser.error("the following arguments are required: skill_path (or --all ROOT)")
 
-    print(f"Packaging skill: {skill_path}")
-    if output_dir:
-        print(f"   Output directory: {output_dir}")
-    print()
+    skill_path = args.skill_path
+    output_dir = args.output_dir
+    stream = None
+    if output_dir == "-":
+        if args.delta_from:
+            parser.error("--delta-from needs an output directory, not -")
+        if sys.stdout.isatty():
+            print("[ERROR] Refusing to write a .skill archive to a terminal; pipe or redirect stdout.")
+            sys.exit(1)
+        stream = sys.stdout.buffer
+        output_dir = None
+
+    # When the archive goes to stdout, the log goes to stderr
+    with contextlib.redirect_stdout(sys.stderr if stream else sys.stdout):
+        print(f"Packaging skill: {skill_path}")
+        if output_dir:
+            print(f"   Output directory: {output_dir}")
+        print()
 
-    result = package_skill(skill_path, output_dir)
+        result = package_skill(
+            skill_path,
+            output_dir,
+            method=args.method,
+            level=args.level,
+            force=args.force,
+            delta_from=args.delta_from,
+            stream=stream,
+        )
 
     if result:
         sys.exit(0)
@@ -108,4 +921,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    profiled(main)()
@@ -1,47 +1,207 @@
 #!/usr/bin/env python3
 """
 Quick validation script for skills - minimal version
+
+Usage:
+    python quick_validate.py <skill_directory>...
+    python quick_validate.py --recursive <skills_root>... [--json]
+    python quick_validate.py --recursive <skills_root>... --watch
+    python quick_validate.py --recursive <skills_root>... --deep
+
+Several skills are validated concurrently in one process; --json prints
+per-skill results as machine-readable JSON.
+
+Results are cached per SKILL.md (~/.openclaw/cache/skill-validation.json,
+override with OPENCLAW_SKILL_VALIDATE_CACHE; --no-cache to bypass). A skill
+whose SKILL.md has the same size and mtime is not read at all; one that was
+only touched is re-hashed but not re-parsed. Any change to the validation
+rules invalidates the whole cache.
+
+SKILL.md is read only up to the closing "---" of its frontmatter. Plain
+single-line "key: value" entries are parsed directly; PyYAML is imported
+only for entries that need it (e.g. the nested metadata block).
+
+--watch keeps running and revalidates only the skills whose SKILL.md changed
+(or that appeared or disappeared). It sleeps on inotify where available and
+polls otherwise; bursts of saves are coalesced into one report.
+
+--deep also byte-compiles every bundled .py file (in parallel, once per
+distinct file content), checks that relative links in SKILL.md point at files
+inside the skill, and looks up metadata.openclaw.requires bins/anyBins with a
+single scan of PATH. Missing binaries are reported as warnings, since they
+describe this machine rather than the skill.
 """
 
+import argparse
+import ctypes
+import hashlib
+import json
+import os
 import re
+import select
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-
-import yaml
+from urllib.parse import unquote
 
 MAX_SKILL_NAME_LENGTH = 64
+MAX_DESCRIPTION_LENGTH = 1024
+ALLOWED_PROPERTIES = {"name", "description", "license", "allowed-tools", "metadata"}
+# A file modified this close to when it was validated may change again within
+# the same mtime tick, so its cache entry is confirmed by content hash
+RACY_WINDOW_NS = 2_000_000_000
+# Directories never searched for skills
+DISCOVERY_SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv"}
 
+WATCH_POLL_INTERVAL = 0.5
+# Quiet period that ends a burst of changes before revalidating
+WATCH_DEBOUNCE = 0.15
+# Rescan this often even with inotify, to catch directories it is not watching
+INOTIFY_RESCAN_INTERVAL = 5.0
 
-def validate_skill(skill_path):
-    """Basic validation of a skill"""
-    skill_path = Path(skill_path)
+MARKDOWN_LINK_RE = re.compile(r"!?\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+[\"'(][^)]*)?\)")
+FENCE_RE = re.compile(r"^(```|~~~)")
+INLINE_CODE_RE = re.compile(r"`[^`]*`")
+URL_SCHEME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*:")
+
+FRONTMATTER_KEY_RE = re.compile(r"([A-Za-z][A-Za-z0-9_-]*):(?:[ \t]+(.*))?")
+# Plain scalars YAML would resolve to booleans or null instead of strings
+YAML_NON_STRING_WORDS = {"yes", "no", "true", "false", "on", "off", "null"}
 
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
-        return False, "SKILL.md not found"
 
-    content = skill_md.read_text()
+def parse_frontmatter(content):
+    """
+    Parse the YAML frontmatter at the top of SKILL.md content.
+
+    Returns (frontmatter, None) on success or (None, error message).
+    """
     if not content.startswith("---"):
-        return False, "No YAML frontmatter found"
+        return None, "No YAML frontmatter found"
 
     match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
     if not match:
-        return False, "Invalid frontmatter format"
+        return None, "Invalid frontmatter format"
+
+    return load_frontmatter(match.group(1))
+
+
+def read_frontmatter_block(skill_md):
+    """
+    Read the frontmatter text of a SKILL.md, stopping at the closing "---".
+
+    The body is never read. Returns (text, None) or (None, error message).
+    """
+    with open(skill_md, encoding="utf-8") as fh:
+        first = fh.readline()
+        if not first.startswith("---"):
+            return None, "No YAML frontmatter found"
+        if first != "---\n":
+            return None, "Invalid frontmatter format"
+        lines = []
+        for line in fh:
+            if line.startswith("---"):
+                if not lines:
+                    break
+                return "".join(lines).removesuffix("\n"), None
+            lines.append(line)
+    return None, "Invalid frontmatter format"
+
+
+def plain_string(value):
+    """Return value if YAML would load it as this exact plain string, else None."""
+    value = value.rstrip()
+    if (
+        not value
+        or not value[0].isalpha()
+        or value.lower() in YAML_NON_STRING_WORDS
+        or ": " in value
+        or value.endswith(":")
+        or " #" in value
+        or "\t" in value
+    ):
+        return None
+    return value
+
+
+def load_frontmatter(text):
+    """
+    Load frontmatter text into a dict; returns (frontmatter, None) or (None, error message).
+
+    Top-level entries that are a single "key: plain value" line are taken
+    as-is. Anything else (nested blocks, flow collections, quoting,
+    continuation lines) is handed to PyYAML, which is imported on first
+    use; if an entry cannot be loaded on its own, the whole block is.
+    """
+    entries = []
+    for line in text.split("\n"):
+        if line[:1] in (" ", "\t") or not line.strip():
+            if not entries:
+                break
+            entries[-1].append(line)
+            continue
+        if not FRONTMATTER_KEY_RE.fullmatch(line):
+            entries = []
+            break
+        entries.append([line])
+
+    frontmatter = {}
+    for entry in entries:
+        key, value = FRONTMATTER_KEY_RE.fullmatch(entry[0]).groups()
+        simple = value is not None and not any(line.strip() for line in entry[1:])
+        if simple and plain_string(value) is not None and key.lower() not in YAML_NON_STRING_WORDS:
+            frontmatter[key] = plain_string(value)
+            continue
+        loaded, error = _yaml_load("\n".join(entry))
+        if error or not isinstance(loaded, dict) or list(loaded) != [key]:
+            break
+        frontmatter.update(loaded)
+    else:
+        if entries:
+            return frontmatter, None
+
+    loaded, error = _yaml_load(text)
+    if error:
+        return None, error
+    if not isinstance(loaded, dict):
+        return None, "Frontmatter must be a YAML dictionary"
+    return loaded, None
+
 
-    frontmatter_text = match.group(1)
+def _yaml_load(text):
+    import yaml
 
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            return False, "Frontmatter must be a YAML dictionary"
+        return yaml.safe_load(text), None
     except yaml.YAMLError as e:
-        return False, f"Invalid YAML in frontmatter: {e}"
+        return None, f"Invalid YAML in frontmatter: {e}"
 
-    allowed_properties = {"name", "description", "license", "allowed-tools", "metadata"}
 
-    unexpected_keys = set(frontmatter.keys()) - allowed_properties
+def validate_skill(skill_path):
+    """Basic validation of a skill"""
+    skill_path = Path(skill_path)
+
+    skill_md = skill_path / "SKILL.md"
+    if not skill_md.exists():
+        return False, "SKILL.md not found"
+
+    text, error = read_frontmatter_block(skill_md)
+    if error:
+        return False, error
+    return validate_frontmatter_text(text)
+
+
+def validate_frontmatter_text(text):
+    """Validate the frontmatter text of a SKILL.md; returns (valid, message)."""
+    frontmatter, error = load_frontmatter(text)
+    if error:
+        return False, error
+
+    unexpected_keys = set(frontmatter.keys()) - ALLOWED_PROPERTIES
     if unexpected_keys:
-        allowed = ", ".join(sorted(allowed_properties))
+        allowed = ", ".join(sorted(ALLOWED_PROPERTIES))
         unexpected = ", ".join(sorted(unexpected_keys))
         return (
             False,
@@ -82,20 +242,494 @@ def validate_skill(skill_path):
     if description:
         if "<" in description or ">" in description:
             return False, "Description cannot contain angle brackets (< or >)"
-        if len(description) > 1024:
+        if len(description) > MAX_DESCRIPTION_LENGTH:
             return (
                 False,
-                f"Description is too long ({len(description)} characters). Maximum is 1024 characters.",
+                f"Description is too long ({len(description)} characters). "
+                f"Maximum is {MAX_DESCRIPTION_LENGTH} characters.",
             )
 
     return True, "Skill is valid!"
 
 
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python quick_validate.py <skill_directory>")
-        sys.exit(1)
+def discover_skills(root):
+    """Return every directory under root containing SKILL.md, without descending into skills."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if "SKILL.md" in filenames:
+            found.append(Path(dirpath))
+            dirnames[:] = []
+            continue
+        dirnames[:] = [name for name in dirnames if name not in DISCOVERY_SKIP_DIRS and not name.startswith(".")]
+    return sorted(found)
+
+
+def rules_hash():
+    """Fingerprint of the validation rules: the limits plus this module's source."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([sorted(ALLOWED_PROPERTIES), MAX_SKILL_NAME_LENGTH, MAX_DESCRIPTION_LENGTH]).encode())
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def default_cache_path():
+    override = os.environ.get("OPENCLAW_SKILL_VALIDATE_CACHE")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".openclaw" / "cache" / "skill-validation.json"
+
+
+def root_cache_path(kind, root):
+    """
+    Per-skills-root cache file, ~/.openclaw/cache/<kind>/<root name>-<hash>.json.
+
+    Keeps generated indexes out of the (often version-controlled) skills tree;
+    OPENCLAW_SKILL_CACHE_DIR replaces ~/.openclaw/cache.
+    """
+    root = Path(root).resolve()
+    base = os.environ.get("OPENCLAW_SKILL_CACHE_DIR")
+    base = Path(base).expanduser() if base else Path.home() / ".openclaw" / "cache"
+    digest = hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:12]
+    return base / kind / f"{root.name or 'root'}-{digest}.json"
+
+
+class ValidationCache:
+    """
+    On-disk map of SKILL.md path -> (size, mtime_ns, sha256) -> validation result.
+
+    The hash covers only the frontmatter block (or the reason it could not be
+    read), since that is all validation looks at; edits to the body alone are
+    answered from the cache without parsing.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.rules = rules_hash()
+        self.entries = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("rules") == self.rules:
+            self.entries = data.get("entries", {})
+
+    def validate(self, skill_md):
+        """Validate one SKILL.md, reading and parsing it only when the cache cannot answer."""
+        key = str(Path(skill_md).resolve())
+        st = os.stat(skill_md)
+        entry = self.entries.get(key)
+        if (
+            entry
+            and entry["size"] == st.st_size
+            and entry["mtime_ns"] == st.st_mtime_ns
+            and entry["mtime_ns"] < entry["checked_ns"] - RACY_WINDOW_NS
+        ):
+            return entry["valid"], entry["message"]
+
+        text, error = read_frontmatter_block(skill_md)
+        sha256 = hashlib.sha256(f"{error}\0{text}".encode("utf-8")).hexdigest()
+        if entry and entry["sha256"] == sha256:
+            valid, message = entry["valid"], entry["message"]
+        elif error:
+            valid, message = False, error
+        else:
+            valid, message = validate_frontmatter_text(text)
+        with self._lock:
+            self.entries[key] = {
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "sha256": sha256,
+                "checked_ns": time.time_ns(),
+                "valid": valid,
+                "message": message,
+            }
+            self.dirty = True
+        return valid, message
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"rules": self.rules, "entries": self.entries}), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self.dirty = False
 
-    valid, message = validate_skill(sys.argv[1])
-    print(message)
-    sys.exit(0 if valid else 1)
+
+def validate_skills(skill_paths, jobs=None, cache=None):
+    """
+    Validate several skills concurrently, consulting cache (a ValidationCache) if given.
+
+    Returns one {"path", "valid", "message"} dict per skill, in input order.
+    """
+    def check(skill_path):
+        skill_md = Path(skill_path) / "SKILL.md"
+        try:
+            if cache is not None and skill_md.is_file():
+                valid, message = cache.validate(skill_md)
+            else:
+                valid, message = validate_skill(skill_path)
+        except (OSError, UnicodeDecodeError) as e:
+            valid, message = False, f"Could not read SKILL.md: {e}"
+        return {"path": str(skill_path), "valid": valid, "message": message}
+
+    with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        return list(pool.map(check, skill_paths))
+
+
+def compile_source(source):
+    """Byte-compile source in memory; returns an error message or None."""
+    try:
+        compile(source, "<script>", "exec", dont_inherit=True)
+    except SyntaxError as e:
+        return f"line {e.lineno}: {e.msg}"
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+def bundled_scripts(skill_path):
+    """Every .py file in the skill folder, skipping caches and virtualenvs."""
+    scripts = []
+    for dirpath, dirnames, filenames in os.walk(skill_path):
+        dirnames[:] = [name for name in dirnames if name not in DISCOVERY_SKIP_DIRS]
+        scripts.extend(Path(dirpath) / name for name in sorted(filenames) if name.endswith(".py"))
+    return scripts
+
+
+def markdown_links(content):
+    """Link targets in markdown content, ignoring fenced code blocks and inline code."""
+    links = []
+    in_fence = False
+    for line in content.splitlines():
+        if FENCE_RE.match(line.lstrip()):
+            in_fence = not in_fence
+            continue
+        if not in_fence:
+            links.extend(MARKDOWN_LINK_RE.findall(INLINE_CODE_RE.sub("", line)))
+    return links
+
+
+def broken_links(skill_path, content):
+    """Relative links in SKILL.md that do not resolve to a file or folder inside the skill."""
+    skill_root = Path(skill_path).resolve()
+    problems = []
+    for target in markdown_links(content):
+        if URL_SCHEME_RE.match(target) or target.startswith(("#", "/")):
+            continue
+        relpath = unquote(target.split("#", 1)[0].split("?", 1)[0])
+        if not relpath:
+            continue
+        resolved = (skill_root / relpath).resolve()
+        if not resolved.is_relative_to(skill_root):
+            problems.append(f"Link points outside the skill folder: {target}")
+        elif not resolved.exists():
+            problems.append(f"Broken link: {target}")
+    return problems
+
+
+@lru_cache(maxsize=None)
+def path_executables():
+    """Scan PATH once: map each file name to its full paths, in PATH order."""
+    found = {}
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            with os.scandir(directory or ".") as entries:
+                for entry in entries:
+                    found.setdefault(entry.name, []).append(entry.path)
+        except OSError:
+            continue
+    return found
+
+
+def which(name):
+    for candidate in path_executables().get(name, []):
+        if os.access(candidate, os.X_OK) and not os.path.isdir(candidate):
+            return candidate
+    return None
+
+
+def missing_binaries(frontmatter):
+    """Warnings for metadata.openclaw.requires bins (all needed) and anyBins (one needed)."""
+    metadata = frontmatter.get("metadata") if isinstance(frontmatter, dict) else None
+    openclaw = metadata.get("openclaw") if isinstance(metadata, dict) else None
+    requires = openclaw.get("requires") if isinstance(openclaw, dict) else None
+    if not isinstance(requires, dict):
+        return []
+    warnings = [
+        f"Required binary not on PATH: {name}"
+        for name in requires.get("bins") or []
+        if not which(str(name))
+    ]
+    any_bins = [str(name) for name in requires.get("anyBins") or []]
+    if any_bins and not any(which(name) for name in any_bins):
+        warnings.append(f"None of these binaries are on PATH: {', '.join(any_bins)}")
+    return warnings
+
+
+def deep_check(skill_paths, jobs=None):
+    """
+    Run the --deep checks over skills; returns {skill_path: (errors, warnings)}.
+
+    Scripts are compiled on a process pool (compile() holds the GIL), each
+    distinct file content only once even when skills share or copy files.
+    """
+    reports = {}
+    sources = {}
+    script_hashes = {}
+    for skill_path in skill_paths:
+        errors, warnings = [], []
+        skill_md = Path(skill_path) / "SKILL.md"
+        try:
+            content = skill_md.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            content = None
+        if content is not None:
+            errors.extend(broken_links(skill_path, content))
+            frontmatter, _ = parse_frontmatter(content)
+            warnings.extend(missing_binaries(frontmatter))
+        reports[skill_path] = (errors, warnings)
+
+        hashes = []
+        for script in bundled_scripts(skill_path):
+            try:
+                source = script.read_bytes()
+            except OSError as e:
+                errors.append(f"Could not read {script}: {e}")
+                continue
+            digest = hashlib.sha256(source).hexdigest()
+            sources.setdefault(digest, source)
+            hashes.append((digest, script.relative_to(skill_path)))
+        script_hashes[skill_path] = hashes
+
+    if sources:
+        digests = list(sources)
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+            outcomes = dict(zip(digests, pool.map(compile_source, [sources[digest] for digest in digests])))
+        for skill_path, hashes in script_hashes.items():
+            for digest, relpath in hashes:
+                if outcomes[digest]:
+                    reports[skill_path][0].append(f"Script does not compile: {relpath}: {outcomes[digest]}")
+    return reports
+
+
+class Inotify:
+    """Just enough of inotify (through libc) to sleep until a watched directory changes."""
+
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watched = set()
+
+    @classmethod
+    def create(cls):
+        """An Inotify, or None where it is unavailable (non-Linux, no free instances)."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            return cls()
+        except (OSError, AttributeError):
+            return None
+
+    def add(self, directories):
+        for directory in directories:
+            if directory not in self.watched:
+                if self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK) >= 0:
+                    self.watched.add(directory)
+
+    def wait(self, timeout):
+        """Block until events arrive or timeout passes; returns True if there were events."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            while os.read(self.fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+
+def skill_md_stat(skill_path):
+    try:
+        st = os.stat(Path(skill_path) / "SKILL.md")
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def watch(paths, recursive=False, jobs=None, cache=None, as_json=False):
+    """
+    Revalidate skills as their SKILL.md files change, until interrupted.
+
+    Results are kept in memory; each pass stats every SKILL.md and only
+    validates the ones that are new or whose size/mtime changed.
+    """
+    def current_skills():
+        if recursive:
+            return [skill for root in paths for skill in discover_skills(root)]
+        return [Path(path) for path in paths]
+
+    def snapshot():
+        return {skill: skill_md_stat(skill) for skill in current_skills()}
+
+    notifier = Inotify.create()
+    results = {}
+    stats = {}
+    first = True
+    try:
+        while True:
+            seen = snapshot()
+            if seen != stats and not first:
+                # Let a burst of saves settle before validating
+                while True:
+                    time.sleep(WATCH_DEBOUNCE)
+                    settled = snapshot()
+                    if settled == seen:
+                        break
+                    seen = settled
+            changed = [skill for skill, st in seen.items() if skill not in stats or stats[skill] != st]
+            removed = [skill for skill in stats if skill not in seen]
+
+            if changed or removed or first:
+                started = time.perf_counter()
+                for skill, result in zip(changed, validate_skills(changed, jobs, cache)):
+                    results[skill] = result
+                for skill in removed:
+                    results.pop(skill, None)
+                stats = seen
+                if cache is not None:
+                    try:
+                        cache.save()
+                    except OSError as e:
+                        print(f"[WARN] Could not write validation cache: {e}", file=sys.stderr)
+                report_watch(results, changed, removed, time.perf_counter() - started, as_json)
+                first = False
+
+            if notifier is not None:
+                directories = {str(root) for root in paths}
+                for skill in seen:
+                    directories.update((str(skill), str(skill.parent)))
+                notifier.add(sorted(directories))
+                if notifier.wait(INOTIFY_RESCAN_INTERVAL):
+                    # A new skill folder may still be getting its SKILL.md
+                    time.sleep(WATCH_DEBOUNCE)
+            else:
+                time.sleep(WATCH_POLL_INTERVAL)
+    except KeyboardInterrupt:
+        pass
+
+
+def report_watch(results, changed, removed, seconds, as_json=False):
+    invalid = sum(not result["valid"] for result in results.values())
+    if as_json:
+        print(json.dumps({
+            "changed": [results[skill] for skill in changed],
+            "removed": [str(skill) for skill in removed],
+            "valid": len(results) - invalid,
+            "invalid": invalid,
+        }), flush=True)
+        return
+    for skill in changed:
+        result = results[skill]
+        if result["valid"]:
+            print(f"[OK] {result['path']}")
+        else:
+            print(f"[ERROR] {result['path']}: {result['message']}")
+    for skill in removed:
+        print(f"[REMOVED] {skill}")
+    print(
+        f"{time.strftime('%H:%M:%S')} {len(results) - invalid} valid, {invalid} invalid "
+        f"({len(changed)} checked in {seconds * 1000:.1f} ms)\n",
+        flush=True,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate skill folders.")
+    parser.add_argument("paths", nargs="+", help="Skill folder(s), or roots to search with --recursive")
+    parser.add_argument(
+        "--recursive",
+        "-r",
+        action="store_true",
+        help="Validate every skill (directory with SKILL.md) under each path",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--jobs", type=int, help="Concurrent validations (default: CPU count + 4, at most 32)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the result cache")
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and revalidate skills whenever their SKILL.md changes",
+    )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Also compile bundled scripts, check relative links and look up required binaries",
+    )
+    args = parser.parse_args()
+
+    if args.watch and args.deep:
+        parser.error("--deep cannot be combined with --watch")
+    if args.watch:
+        cache = None if args.no_cache else ValidationCache(default_cache_path())
+        watch(args.paths, args.recursive, args.jobs, cache, args.json)
+        return
+
+    if args.recursive:
+        skill_paths = [skill for root in args.paths for skill in discover_skills(root)]
+    else:
+        skill_paths = [Path(path) for path in args.paths]
+
+    cache = None if args.no_cache else ValidationCache(default_cache_path())
+    results = validate_skills(skill_paths, args.jobs, cache)
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"[WARN] Could not write validation cache: {e}", file=sys.stderr)
+    if args.deep:
+        reports = deep_check(skill_paths, args.jobs)
+        for skill_path, result in zip(skill_paths, results):
+            errors, warnings = reports[skill_path]
+            result["errors"], result["warnings"] = errors, warnings
+            if errors:
+                result["valid"] = False
+    invalid = sum(not result["valid"] for result in results)
+
+    if args.json:
+        summary = {"valid": len(results) - invalid, "invalid": invalid, "skills": results}
+        print(json.dumps(summary, indent=2))
+    elif len(results) == 1 and not args.recursive and not args.deep:
+        print(results[0]["message"])
+    else:
+        for result in results:
+            if result["valid"]:
+                print(f"[OK] {result['path']}")
+            elif not result.get("errors") or result["message"] != "Skill is valid!":
+                print(f"[ERROR] {result['path']}: {result['message']}")
+            else:
+                print(f"[ERROR] {result['path']}")
+            for error in result.get("errors", []):
+                print(f"   [ERROR] {error}")
+            for warning in result.get("warnings", []):
+                print(f"   [WARN] {warning}")
+        print(f"\n{len(results) - invalid} valid, {invalid} invalid")
+    sys.exit(1 if invalid or not results else 0)
+
+
+if __name__ == "__main__":
+    main()
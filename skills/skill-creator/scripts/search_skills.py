@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Skill Search - Ranked full-text search over skill names, descriptions and headings
+
+Usage:
+    python utils/search_skills.py <skills-root> <query> [-k 5] [--json] [--rebuild]
+
+Example:
+    python utils/search_skills.py skills "generate an image from a prompt"
+    python utils/search_skills.py skills "send slack message" -k 3 --json
+
+Scores skills with BM25 over one weighted document per skill: the name counts
+NAME_WEIGHT times, the description DESCRIPTION_WEIGHT times and each section
+heading of SKILL.md once. The inverted index is kept in
+~/.openclaw/cache/skill-search/ (one file per skills root, outside the skills
+tree); before each search it is refreshed for skills whose SKILL.md was added,
+removed or changed (by size and mtime), so unchanged skills are never re-read.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from quick_validate import FENCE_RE, RACY_WINDOW_NS, discover_skills, parse_frontmatter, root_cache_path
+
+INDEX_VERSION = 1
+
+NAME_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 2.0
+HEADING_WEIGHT = 1.0
+# BM25 term-frequency saturation and length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in", "into", "is", "it",
+    "of", "on", "or", "the", "this", "to", "use", "via", "when", "with", "you", "your",
+}
+
+
+def tokenize(text):
+    """Lowercase word tokens without stopwords; a plain plural "s" is dropped so image/images match."""
+    tokens = []
+    for token in TOKEN_RE.findall(str(text).lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def section_headings(content):
+    """Markdown headings (without the leading #'s), skipping fenced code blocks."""
+    headings = []
+    in_fence = False
+    for line in content.splitlines():
+        if FENCE_RE.match(line.lstrip()):
+            in_fence = not in_fence
+        elif not in_fence and line.startswith("#"):
+            headings.append(line.lstrip("#").strip())
+    return headings
+
+
+def index_skill(skill_md):
+    """Weighted term frequencies and display fields for one SKILL.md."""
+    content = Path(skill_md).read_text(encoding="utf-8")
+    frontmatter, _ = parse_frontmatter(content)
+    frontmatter = frontmatter or {}
+    name = frontmatter.get("name") or Path(skill_md).parent.name
+    description = frontmatter.get("description") or ""
+
+    terms = Counter()
+    for token in tokenize(str(name).replace("-", " ")):
+        terms[token] += NAME_WEIGHT
+    for token in tokenize(description):
+        terms[token] += DESCRIPTION_WEIGHT
+    for heading in section_headings(content):
+        for token in tokenize(heading):
+            terms[token] += HEADING_WEIGHT
+    return {
+        "name": str(name),
+        "description": str(description),
+        "terms": dict(terms),
+        "length": sum(terms.values()),
+    }
+
+
+def load_index(path):
+    try:
+        index = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return None
+    return index
+
+
+def refresh_index(root, index_path=None, rebuild=False):
+    """
+    Bring the search index for root up to date and return it.
+
+    Only skills whose SKILL.md is new or changed are re-read; the postings
+    lists are rebuilt from the per-skill term counts whenever anything changed.
+    """
+    root = Path(root).resolve()
+    index_path = Path(index_path) if index_path else root_cache_path("skill-search", root)
+    previous = None if rebuild else load_index(index_path)
+    previous_docs = previous["docs"] if previous else {}
+    built_ns = previous["built_ns"] if previous else 0
+
+    docs = {}
+    changed = 0
+    started_ns = time.time_ns()
+    for skill_path in discover_skills(root):
+        key = skill_path.relative_to(root).as_posix()
+        st = (skill_path / "SKILL.md").stat()
+        old = previous_docs.get(key)
+        if (
+            old
+            and old["size"] == st.st_size
+            and old["mtime_ns"] == st.st_mtime_ns
+            and st.st_mtime_ns < built_ns - RACY_WINDOW_NS
+        ):
+            docs[key] = old
+            continue
+        try:
+            doc = index_skill(skill_path / "SKILL.md")
+        except (OSError, UnicodeDecodeError):
+            continue
+        doc.update(size=st.st_size, mtime_ns=st.st_mtime_ns)
+        docs[key] = doc
+        changed += 1
+
+    if previous and not changed and docs.keys() == previous_docs.keys():
+        return previous
+
+    postings = {}
+    for key, doc in docs.items():
+        for term, frequency in doc["terms"].items():
+            postings.setdefault(term, []).append([key, frequency])
+    index = {
+        "version": INDEX_VERSION,
+        "built_ns": started_ns,
+        "avg_length": sum(doc["length"] for doc in docs.values()) / len(docs) if docs else 0.0,
+        "docs": docs,
+        "postings": postings,
+    }
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, index_path)
+    return index
+
+
+def search(index, query, limit=5):
+    """Return up to limit (score, key, doc) tuples for query, best first."""
+    docs = index["docs"]
+    total = len(docs)
+    avg_length = index["avg_length"] or 1.0
+    scores = Counter()
+    for term in set(tokenize(query)):
+        postings = index["postings"].get(term)
+        if not postings:
+            continue
+        idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+        for key, frequency in postings:
+            length = docs[key]["length"]
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+            scores[key] += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+    return [(score, key, docs[key]) for key, score in scores.most_common(limit)]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Search skills by name, description and section headings.",
+    )
+    parser.add_argument("root", help="Directory containing the skills")
+    parser.add_argument("query", nargs="+", help="Search terms")
+    parser.add_argument("-k", "--limit", type=int, default=5, help="Number of results (default: 5)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the index from scratch")
+    args = parser.parse_args()
+
+    if not Path(args.root).is_dir():
+        print(f"[ERROR] Skills root not found: {args.root}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    index = refresh_index(args.root, rebuild=args.rebuild)
+    results = search(index, " ".join(args.query), args.limit)
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps([
+            {"skill": key, "name": doc["name"], "description": doc["description"], "score": round(score, 4)}
+            for score, key, doc in results
+        ], indent=2))
+        return
+    if not results:
+        print("No matching skills.")
+        return
+    for score, key, doc in results:
+        description = doc["description"] if len(doc["description"]) <= 100 else doc["description"][:97] + "..."
+        print(f"{score:7.2f}  {key}: {description}")
+    print(f"\n{len(results)} result(s) from {len(index['docs'])} skills in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Skill Profiler - Opt-in CPU, memory and phase profiling for skill scripts
+
+Usage:
+    OPENCLAW_SKILL_PROFILE=1 python <skill>/scripts/<script>.py ...
+    OPENCLAW_SKILL_PROFILE=/tmp/profiles python <skill>/scripts/<script>.py ...
+    python utils/skill_profile.py <report.json>...
+
+Example:
+    OPENCLAW_SKILL_PROFILE=1 python utils/package_skill.py skills/public/my-skill ./dist
+    python -m pstats ~/.openclaw/profiles/package_skill-20260101-120000-4242.prof
+
+Scripts opt in by running their main() through profiled(main) and marking
+their phases with `with phase("name"):`. When OPENCLAW_SKILL_PROFILE is unset
+(or 0/false/off), profiled() calls main directly and phase() does nothing.
+Scripts in other skills opt in from their __main__ block: only when the
+variable is set, they append this directory to sys.path as
+
+    Path(__file__).resolve().parents[2] / "skill-creator" / "scripts"
+
+(skills are sibling folders), import profiled and wrap main with it. They
+mark phases with a module-level `profile_phase = nullcontext`, which
+profiled() points at phase() for the profiled run.
+
+A value of 1/true/yes/on writes reports to ~/.openclaw/profiles; any other
+value is the directory to write them to. Each run writes
+<script>-<timestamp>-<pid> with three suffixes:
+
+    .prof   cProfile stats, for python -m pstats, snakeviz and similar
+    .txt    phase wall times, slowest functions and top allocations
+    .json   the same summary, machine-readable
+
+Only the main thread is profiled by cProfile and tracemalloc only sees this
+process: work done in thread or process pools shows up as time spent waiting
+on them. Command-line arguments are not recorded, since they may hold keys.
+
+Run this file with report .json paths to print their phase summaries.
+"""
+
+import functools
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+PROFILE_ENV = "OPENCLAW_SKILL_PROFILE"
+DISABLED_VALUES = {"", "0", "false", "no", "off"}
+DEFAULT_DIR_VALUES = {"1", "true", "yes", "on"}
+
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 15
+
+# Start time of the profiled run, or None when nothing is being profiled
+_started = None
+_depth = 0
+_phases = []
+
+
+def profile_dir():
+    """Directory to write reports to, or None if profiling is off."""
+    value = os.environ.get(PROFILE_ENV, "").strip()
+    if value.lower() in DISABLED_VALUES:
+        return None
+    if value.lower() in DEFAULT_DIR_VALUES:
+        return Path.home() / ".openclaw" / "profiles"
+    return Path(value).expanduser()
+
+
+@contextmanager
+def phase(name):
+    """Record the wall time of a block as a named phase of the current profile."""
+    global _depth
+    if _started is None:
+        yield
+        return
+    start = time.perf_counter()
+    _depth += 1
+    try:
+        yield
+    finally:
+        _depth -= 1
+        _phases.append({
+            "name": name,
+            "start_ms": round((start - _started) * 1000, 3),
+            "ms": round((time.perf_counter() - start) * 1000, 3),
+            "depth": _depth,
+        })
+
+
+def profiled(main):
+    """Wrap a script's main() so each call is profiled when OPENCLAW_SKILL_PROFILE is set."""
+
+    @functools.wraps(main)
+    def wrapper(*args, **kwargs):
+        global _started
+        output_dir = profile_dir()
+        # A run already being profiled (e.g. a forked worker child) is covered by that profile
+        if output_dir is None or _started is not None:
+            return main(*args, **kwargs)
+
+        import cProfile
+        import tracemalloc
+
+        script = Path(sys.argv[0]).stem or main.__module__
+        module = sys.modules.get(main.__module__)
+        if hasattr(module, "profile_phase"):
+            module.profile_phase = phase
+        _phases.clear()
+        tracemalloc.start()
+        profiler = cProfile.Profile()
+        outcome = "returned"
+        _started = time.perf_counter()
+        try:
+            return profiler.runcall(main, *args, **kwargs)
+        except SystemExit as e:
+            outcome = f"exit {e.code}"
+            raise
+        except BaseException as e:
+            outcome = f"raised {type(e).__name__}"
+            raise
+        finally:
+            wall_ms = (time.perf_counter() - _started) * 1000
+            _started = None
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            try:
+                report = write_report(output_dir, script, profiler, snapshot, peak, wall_ms, outcome)
+                print(f"[profile] {script}: {wall_ms:.0f} ms, report in {report}", file=sys.stderr)
+            except OSError as e:
+                print(f"[WARN] Could not write profile to {output_dir}: {e}", file=sys.stderr)
+
+    return wrapper
+
+
+def top_allocations(snapshot):
+    """Largest allocation sites still alive at the end of the run, by source line."""
+    import tracemalloc
+
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+    return [
+        {"where": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", "bytes": stat.size, "count": stat.count}
+        for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+    ]
+
+
+def write_report(output_dir, script, profiler, snapshot, peak, wall_ms, outcome):
+    """Write the .prof, .txt and .json files for one run; returns the .txt path."""
+    import io
+    import pstats
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = output_dir / f"{script}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+    profiler.dump_stats(f"{stem}.prof")
+
+    phases = sorted(_phases, key=lambda entry: entry["start_ms"])
+    allocations = top_allocations(snapshot)
+    summary = {
+        "script": script,
+        "ts": time.time(),
+        "outcome": outcome,
+        "wall_ms": round(wall_ms, 3),
+        "peak_traced_bytes": peak,
+        "phases": phases,
+        "top_allocations": allocations,
+    }
+    Path(f"{stem}.json").write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+
+    text = io.StringIO()
+    text.write(f"{script}: {outcome} after {wall_ms:.1f} ms, peak traced memory {peak / 1024 / 1024:.1f} MB\n\n")
+    text.write(format_phases(phases))
+    text.write(f"\nTop {len(allocations)} allocation sites still alive at exit:\n")
+    for allocation in allocations:
+        text.write(f"  {allocation['bytes'] / 1024:>10.1f} KB  {allocation['count']:>7} blocks  {allocation['where']}\n")
+    text.write(f"\nSlowest {TOP_FUNCTIONS} functions by cumulative time:\n")
+    pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+    Path(f"{stem}.txt").write_text(text.getvalue(), encoding="utf-8")
+    return Path(f"{stem}.txt")
+
+
+def format_phases(phases):
+    if not phases:
+        return "No phases recorded.\n"
+    lines = ["Phases (wall time):\n"]
+    for entry in phases:
+        lines.append(f"  {entry['start_ms']:>10.1f} ms  {entry['ms']:>10.1f} ms  {'  ' * entry['depth']}{entry['name']}\n")
+    return "".join(lines)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__.strip())
+        sys.exit(1)
+    for path in sys.argv[1:]:
+        try:
+            summary = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Could not read {path}: {e}")
+            sys.exit(1)
+        print(f"{path}: {summary['script']} {summary['outcome']} after {summary['wall_ms']:.1f} ms")
+        print(format_phases(summary["phases"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Skill Worker - Persistent warm worker shared by skill scripts
+
+Usage (from a script in another skill, loaded through skill-creator/scripts):
+    exit_code = skill_worker.forward(sys.argv[1:], **WORKER_OPTIONS)
+    skill_worker.serve(argv, main, warm_up=..., prog="generate_image.py --serve", **WORKER_OPTIONS)
+
+WORKER_OPTIONS describes one skill's worker:
+
+    name          socket file name, e.g. "nano-banana-pro"
+    env_prefix    <env_prefix>=0 disables forwarding, <env_prefix>_SOCKET overrides the socket path
+    forward_env   prefixes of the caller's variables the worker needs, e.g. ("GEMINI_",)
+
+forward() returns the worker's exit code after streaming its stdout/stderr
+through, or None when no trusted worker is listening so the caller runs
+locally. serve() warms up once, then forks a child per invocation that adopts
+the caller's cwd and forwarded variables and runs main(argv), profiled when
+OPENCLAW_SKILL_PROFILE is set.
+
+The socket is <name>-<uid>.sock in $XDG_RUNTIME_DIR, or else in a private 0700
+directory openclaw-workers-<uid> under the system temp dir. Scripts may check
+that path exists before importing this module, so runs without a worker skip
+the import. Both ends refuse a socket or
+peer owned by another user, and only the forward_env variables plus OPENCLAW_*,
+proxy, CA bundle and locale settings cross the socket.
+"""
+
+import argparse
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+from skill_profile import profiled
+
+SHARED_ENV_PREFIXES = ("OPENCLAW_",)
+SHARED_ENV = {
+    "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "ALL_PROXY",
+    "http_proxy", "https_proxy", "no_proxy", "all_proxy",
+    "SSL_CERT_FILE", "SSL_CERT_DIR", "REQUESTS_CA_BUNDLE",
+    "LANG", "LC_ALL", "TZ",
+}
+
+
+def forwarded_env(environ, forward_env=()):
+    """The variables of environ a worker may receive."""
+    prefixes = SHARED_ENV_PREFIXES + tuple(forward_env)
+    return {key: value for key, value in environ.items() if key in SHARED_ENV or key.startswith(prefixes)}
+
+
+def private_dir(create=False):
+    """This user's 0700 socket directory under the system temp dir, or None if missing or unsafe."""
+    path = Path(tempfile.gettempdir()) / f"openclaw-workers-{os.getuid()}"
+    try:
+        if create:
+            path.mkdir(mode=0o700, exist_ok=True)
+        info = path.lstat()
+    except OSError:
+        return None
+    # Another user may have created the path first
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        return None
+    return path
+
+
+def socket_path(name, env_prefix, create=False):
+    """Unix socket of the worker, or None when there is no safe place for it."""
+    override = os.environ.get(f"{env_prefix}_SOCKET")
+    if override:
+        return override
+    base = os.environ.get("XDG_RUNTIME_DIR") or private_dir(create)
+    return os.path.join(base, f"{name}-{os.getuid()}.sock") if base else None
+
+
+def untrusted_reason(path):
+    """Why the existing file at path is not this user's socket, or None if it is."""
+    info = os.lstat(path)
+    if not stat.S_ISSOCK(info.st_mode):
+        return "not a socket"
+    if info.st_uid != os.getuid():
+        return f"owned by uid {info.st_uid}"
+    return None
+
+
+def peer_uid(sock):
+    """uid of the process on the other end of a connected Unix socket, or None if the OS won't say."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that forwards writes to the worker client as JSON frames."""
+
+    def __init__(self, wfile, fd):
+        self.wfile = wfile
+        self.fd = fd
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if data:
+            frame = json.dumps({"fd": self.fd, "data": data}) + "\n"
+            self.wfile.write(frame.encode("utf-8"))
+            self.wfile.flush()
+        return len(data)
+
+
+class _WorkerHandler(socketserver.StreamRequestHandler):
+    """Runs one forwarded invocation in a forked child of the warm worker."""
+
+    def handle(self):
+        if peer_uid(self.request) not in (None, os.getuid()):
+            return
+        line = self.rfile.readline()
+        if not line:
+            # Liveness probe from another worker starting up
+            return
+        request = json.loads(line)
+        # The child is disposable, so adopting the caller's cwd and settings is safe
+        os.chdir(request["cwd"])
+        for key in forwarded_env(os.environ, self.server.forward_env):
+            del os.environ[key]
+        os.environ.update(forwarded_env(request["env"], self.server.forward_env))
+        sys.stdout = _FrameWriter(self.wfile, 1)
+        sys.stderr = _FrameWriter(self.wfile, 2)
+
+        try:
+            exit_code = profiled(self.server.main)(request["argv"]) or 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                exit_code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+        self.wfile.write((json.dumps({"exit": exit_code}) + "\n").encode("utf-8"))
+
+
+class _WorkerServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    def __init__(self, path, main, forward_env):
+        self.main = main
+        self.forward_env = tuple(forward_env)
+        super().__init__(path, _WorkerHandler)
+
+
+def serve(argv, main, name, env_prefix, forward_env=(), warm_up=None, prog=None, description=None):
+    """
+    Warm up, then serve forwarded invocations of main on a Unix socket.
+
+    Args:
+        argv: Arguments after --serve
+        main: The script's main(argv)
+        name, env_prefix, forward_env: The skill's WORKER_OPTIONS
+        warm_up: Called once before forking, to preload imports and clients
+        prog, description: For the --serve help text
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    parser.add_argument(
+        "--socket",
+        default=socket_path(name, env_prefix, create=True),
+        help=f"Unix socket path (default: ${env_prefix}_SOCKET, else a per-user path in $XDG_RUNTIME_DIR "
+             "or a private openclaw-workers-<uid> directory under the system temp dir)",
+    )
+    args = parser.parse_args(argv)
+    if not args.socket:
+        print("Error: No private directory for the worker socket; set XDG_RUNTIME_DIR or pass --socket", file=sys.stderr)
+        return 1
+
+    if warm_up:
+        warm_up()
+
+    if os.path.lexists(args.socket):
+        reason = untrusted_reason(args.socket)
+        if reason:
+            print(f"Error: {args.socket} is {reason}; refusing to replace it", file=sys.stderr)
+            return 1
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(args.socket)
+            print(f"Error: A worker is already listening on {args.socket}", file=sys.stderr)
+            return 1
+        except OSError:
+            # Stale socket from a previous worker
+            os.unlink(args.socket)
+        finally:
+            probe.close()
+
+    # Owner-only socket: forwarded requests carry the caller's keys
+    old_umask = os.umask(0o177)
+    try:
+        server = _WorkerServer(args.socket, main, forward_env)
+    finally:
+        os.umask(old_umask)
+
+    server_pid = os.getpid()
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"Worker listening on {args.socket}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Forked children share this frame; only the listening process cleans up
+        if os.getpid() == server_pid:
+            server.server_close()
+            Path(args.socket).unlink(missing_ok=True)
+    return 0
+
+
+def forward(argv, name, env_prefix, forward_env=()):
+    """
+    Run argv on a warm worker if one of this user's is listening.
+
+    Returns:
+        The worker's exit code, or None when no trusted worker is reachable
+        (or <env_prefix>=0) so the caller can run locally
+    """
+    if os.environ.get(env_prefix) == "0" or not hasattr(socket, "AF_UNIX"):
+        return None
+    path = socket_path(name, env_prefix)
+    if not path:
+        return None
+    try:
+        reason = untrusted_reason(path)
+    except OSError:
+        return None
+    if reason:
+        print(f"Warning: Ignoring worker socket {path} ({reason})", file=sys.stderr)
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    uid = peer_uid(sock)
+    if uid not in (None, os.getuid()):
+        sock.close()
+        print(f"Warning: Ignoring worker on {path} (run by uid {uid})", file=sys.stderr)
+        return None
+
+    with sock, sock.makefile("rwb") as conn:
+        request = {"argv": argv, "cwd": os.getcwd(), "env": forwarded_env(os.environ, forward_env)}
+        conn.write((json.dumps(request) + "\n").encode("utf-8"))
+        conn.flush()
+        for line in conn:
+            frame = json.loads(line)
+            if "exit" in frame:
+                return frame["exit"]
+            stream = sys.stdout if frame["fd"] == 1 else sys.stderr
+            stream.write(frame["data"])
+            stream.flush()
+
+    print("Error: Worker closed the connection unexpectedly.", file=sys.stderr)
+    return 1